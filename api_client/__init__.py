@@ -1,4 +1,28 @@
-from .client import APIClient, JSONPlaceholderClient
+from importlib import import_module
 
-__all__ = ['APIClient', 'JSONPlaceholderClient']
-__version__ = '1.0.0'
\ No newline at end of file
+__all__ = ['APIClient', 'JSONPlaceholderClient', 'DatasetSnapshot', 'HedgePolicy',
+           'CircuitBreakers', 'CircuitOpenError', 'BulkResult']
+__version__ = '1.0.0'
+
+_LAZY_ATTRS = {
+    'APIClient': '.client',
+    'JSONPlaceholderClient': '.client',
+    'DatasetSnapshot': '.dataset',
+    'HedgePolicy': '.hedging',
+    'CircuitBreakers': '.circuit_breaker',
+    'CircuitOpenError': '.circuit_breaker',
+    'BulkResult': '.bulk',
+}
+
+
+def __getattr__(name):
+    # Submodules (and requests/urllib3) are imported on first attribute access.
+    if name in _LAZY_ATTRS:
+        value = getattr(import_module(_LAZY_ATTRS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
\ No newline at end of file
@@ -0,0 +1,58 @@
+import uuid
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Any, Callable, Iterable, Iterator, Optional
+
+import requests
+
+IDEMPOTENCY_HEADER = "Idempotency-Key"
+
+
+def new_idempotency_key() -> str:
+    return str(uuid.uuid4())
+
+
+@dataclass
+class BulkResult:
+    index: int
+    item: Any
+    idempotency_key: str
+    response: Optional[requests.Response] = None
+    error: Optional[Exception] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None and self.response is not None and self.response.ok
+
+
+def run_bulk(send: Callable[[Any, str], requests.Response], items: Iterable[Any],
+             max_workers: int) -> Iterator[BulkResult]:
+    """Run send(item, idempotency_key) for every item with at most max_workers in flight.
+
+    Items are pulled lazily from the iterable and results are yielded in
+    completion order; failures are reported on the result instead of raised.
+    """
+    source = enumerate(items)
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="bulk") as executor:
+        pending = {}
+
+        def submit_next() -> bool:
+            for index, item in source:
+                key = new_idempotency_key()
+                pending[executor.submit(send, item, key)] = BulkResult(index, item, key)
+                return True
+            return False
+
+        while len(pending) < max_workers and submit_next():
+            pass
+
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                result = pending.pop(future)
+                try:
+                    result.response = future.result()
+                except Exception as e:
+                    result.error = e
+                yield result
+                submit_next()
@@ -0,0 +1,141 @@
+import threading
+import time
+from collections import deque
+from typing import Callable, Dict, List, Tuple
+from urllib.parse import urlsplit
+
+import requests
+
+from .endpoints import endpoint_template
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(requests.exceptions.ConnectionError):
+    def __init__(self, name: str, retry_after: float):
+        super().__init__(f"Circuit open for {name}, retry in {retry_after:.1f}s")
+        self.name = name
+        self.retry_after = retry_after
+
+
+class CircuitBreaker:
+    """Closed/open/half-open breaker driven by error rate and slow-call rate.
+
+    Outcomes of the last `window` calls are kept; once at least `min_calls`
+    were seen and either rate reaches its threshold the circuit opens and
+    calls fail fast for `open_seconds`. After that a single probe call is let
+    through (half-open): success closes the circuit, failure re-opens it.
+    """
+
+    def __init__(self, name: str, failure_rate: float = 0.5, slow_call_rate: float = 0.8,
+                 slow_call_seconds: float = 5.0, min_calls: int = 5, window: int = 20,
+                 open_seconds: float = 30.0, clock: Callable[[], float] = time.monotonic):
+        self.name = name
+        self.failure_rate = failure_rate
+        self.slow_call_rate = slow_call_rate
+        self.slow_call_seconds = slow_call_seconds
+        self.min_calls = min_calls
+        self.open_seconds = open_seconds
+        self.clock = clock
+        self._outcomes = deque(maxlen=window)
+        self._state = CLOSED
+        self._opened_at = 0.0
+        self._probing = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            return self._current_state()
+
+    def _current_state(self) -> str:
+        if self._state == OPEN and self.clock() - self._opened_at >= self.open_seconds:
+            self._state = HALF_OPEN
+            self._probing = False
+        return self._state
+
+    def before_call(self):
+        with self._lock:
+            state = self._current_state()
+            if state == CLOSED:
+                return
+            if state == HALF_OPEN and not self._probing:
+                self._probing = True
+                return
+            retry_after = max(self.open_seconds - (self.clock() - self._opened_at), 0.0)
+        raise CircuitOpenError(self.name, retry_after)
+
+    def cancel_probe(self):
+        with self._lock:
+            self._probing = False
+
+    def record(self, success: bool, duration: float):
+        slow = duration >= self.slow_call_seconds
+        with self._lock:
+            if self._state == HALF_OPEN:
+                self._probing = False
+                if success and not slow:
+                    self._state = CLOSED
+                    self._outcomes.clear()
+                else:
+                    self._trip()
+                return
+            self._outcomes.append((success, slow))
+            if self._state == CLOSED and self._should_trip():
+                self._trip()
+
+    def _should_trip(self) -> bool:
+        calls = len(self._outcomes)
+        if calls < self.min_calls:
+            return False
+        failures = sum(1 for success, _ in self._outcomes if not success)
+        slow_calls = sum(1 for _, slow in self._outcomes if slow)
+        return failures / calls >= self.failure_rate or slow_calls / calls >= self.slow_call_rate
+
+    def _trip(self):
+        self._state = OPEN
+        self._opened_at = self.clock()
+        self._outcomes.clear()
+
+
+class CircuitBreakers:
+    """Breakers for each host and for each (host, endpoint template) pair."""
+
+    def __init__(self, **breaker_kwargs):
+        self.breaker_kwargs = breaker_kwargs
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self._lock = threading.Lock()
+
+    def _get(self, name: str) -> CircuitBreaker:
+        with self._lock:
+            if name not in self._breakers:
+                self._breakers[name] = CircuitBreaker(name, **self.breaker_kwargs)
+            return self._breakers[name]
+
+    def for_url(self, method: str, url: str) -> Tuple[CircuitBreaker, CircuitBreaker]:
+        parts = urlsplit(url)
+        host = parts.netloc
+        return self._get(host), self._get(f"{method} {host}{endpoint_template(parts.path)}")
+
+    def acquire(self, method: str, url: str) -> Tuple[CircuitBreaker, ...]:
+        """Admit a call through the host and endpoint breakers or raise CircuitOpenError."""
+        admitted = []
+        try:
+            for breaker in self.for_url(method, url):
+                breaker.before_call()
+                admitted.append(breaker)
+        except CircuitOpenError:
+            for breaker in admitted:
+                breaker.cancel_probe()
+            raise
+        return tuple(admitted)
+
+    def states(self) -> Dict[str, str]:
+        with self._lock:
+            breakers = list(self._breakers.values())
+        return {b.name: b.state for b in breakers}
+
+    def open_circuits(self) -> List[str]:
+        return [name for name, state in self.states().items() if state == OPEN]
@@ -1,14 +1,32 @@
 import logging
-from typing import Optional, Dict, Any
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import TYPE_CHECKING, Optional, Dict, Any, Callable, Iterable, Iterator
 import requests
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
+from .bulk import IDEMPOTENCY_HEADER, BulkResult, new_idempotency_key, run_bulk
+
+if TYPE_CHECKING:
+    from .circuit_breaker import CircuitBreakers
+    from .hedging import HedgePolicy
+
 
 class APIClient:
-    def __init__(self, base_url: str, timeout: int = 10):
+    def __init__(self, base_url: str, timeout: int = 10, http2: bool = False,
+                 hedge: Optional["HedgePolicy"] = None,
+                 circuit_breakers: Optional["CircuitBreakers"] = None, pool_size: int = 10,
+                 request_observer: Optional[Callable[[str, str, float, float], None]] = None):
         self.base_url = base_url.rstrip('/')
         self.timeout = timeout
+        self.http2 = http2
+        self.pool_size = pool_size
+        self.hedge_policy = hedge
+        self._hedge_executor: Optional[ThreadPoolExecutor] = None
+        self.circuit_breakers = circuit_breakers
+        # Called with (method, url, wall seconds, CPU seconds of the calling thread) per request.
+        self.request_observer = request_observer
         self.session = self._create_session()
         self.logger = logging.getLogger(self.__class__.__name__)
 
@@ -20,9 +38,13 @@ class APIClient:
             status_forcelist=[429, 500, 502, 503, 504],
             allowed_methods=["HEAD", "GET", "OPTIONS", "POST", "PUT", "DELETE"]
         )
-        adapter = HTTPAdapter(max_retries=retry_strategy)
+        adapter = HTTPAdapter(max_retries=retry_strategy, pool_maxsize=self.pool_size)
         session.mount("http://", adapter)
         session.mount("https://", adapter)
+        if self.http2:
+            from .transports import create_http2_adapter
+            # HTTP/2 is negotiated via ALPN, so it only applies to https:// URLs.
+            session.mount("https://", create_http2_adapter(retry_strategy))
         return session
 
     def _log_request(self, method: str, url: str, **kwargs):
@@ -37,38 +59,110 @@ class APIClient:
         except ValueError:
             self.logger.debug(response.text)
 
-    def get(self, endpoint: str, **kwargs) -> requests.Response:
+    def _request(self, method: str, endpoint: str, **kwargs) -> requests.Response:
         url = f"{self.base_url}/{endpoint.lstrip('/')}"
-        self._log_request("GET", url, **kwargs)
-        response = self.session.get(url, timeout=self.timeout, **kwargs)
+        self._log_request(method, url, **kwargs)
+        started, cpu_started = time.perf_counter(), time.thread_time()
+        try:
+            if self.circuit_breakers is None:
+                response = self._send(method, url, **kwargs)
+            else:
+                response = self._send_guarded(method, url, **kwargs)
+        finally:
+            if self.request_observer is not None:
+                self.request_observer(
+                    method, url, time.perf_counter() - started, time.thread_time() - cpu_started
+                )
         self._log_response(response)
         return response
 
-    def post(self, endpoint: str, json: Optional[Dict[str, Any]] = None, **kwargs) -> requests.Response:
-        url = f"{self.base_url}/{endpoint.lstrip('/')}"
-        self._log_request("POST", url, json=json, **kwargs)
-        response = self.session.post(url, json=json, timeout=self.timeout, **kwargs)
-        self._log_response(response)
+    def _send(self, method: str, url: str, **kwargs) -> requests.Response:
+        if method == "GET" and self.hedge_policy is not None:
+            return self._send_hedged(url, **kwargs)
+        return self.session.request(method, url, timeout=self.timeout, **kwargs)
+
+    def _send_guarded(self, method: str, url: str, **kwargs) -> requests.Response:
+        breakers = self.circuit_breakers.acquire(method, url)
+        started = time.monotonic()
+        try:
+            response = self._send(method, url, **kwargs)
+        except Exception:
+            for breaker in breakers:
+                breaker.record(False, time.monotonic() - started)
+            raise
+        for breaker in breakers:
+            breaker.record(response.status_code < 500, time.monotonic() - started)
         return response
 
+    def _send_hedged(self, url: str, **kwargs) -> requests.Response:
+        policy = self.hedge_policy
+        policy.record_request()
+        if self._hedge_executor is None:
+            self._hedge_executor = ThreadPoolExecutor(thread_name_prefix="hedge")
+
+        def send():
+            return self.session.get(url, timeout=self.timeout, **kwargs)
+
+        # Each request's latency is measured from its own submission, so a
+        # winning hedge does not record the hedge delay on top of its own time.
+        started = {}
+
+        def submit():
+            now = time.monotonic()
+            future = self._hedge_executor.submit(send)
+            started[future] = now
+            return future
+
+        pending = {submit()}
+        delay = policy.delay()
+        if delay is not None:
+            done, _ = wait(pending, timeout=delay)
+            if not done and policy.try_hedge():
+                self.logger.info(f"Hedging GET {url} after {delay:.3f}s")
+                pending.add(submit())
+
+        error = None
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future.exception() is not None:
+                    error = future.exception()
+                    continue
+                policy.latencies.record(time.monotonic() - started[future])
+                for loser in pending:
+                    # Drop the slower request; if it is already in flight its
+                    # connection is released back to the pool once it returns.
+                    if not loser.cancel():
+                        loser.add_done_callback(_close_response)
+                return future.result()
+        raise error
+
+    def get(self, endpoint: str, **kwargs) -> requests.Response:
+        return self._request("GET", endpoint, **kwargs)
+
+    def post(self, endpoint: str, json: Optional[Dict[str, Any]] = None, **kwargs) -> requests.Response:
+        # The key is sent unchanged on every retry of this call, so the server can deduplicate them.
+        headers = dict(kwargs.pop("headers", None) or {})
+        headers.setdefault(IDEMPOTENCY_HEADER, new_idempotency_key())
+        return self._request("POST", endpoint, json=json, headers=headers, **kwargs)
+
     def put(self, endpoint: str, json: Optional[Dict[str, Any]] = None, **kwargs) -> requests.Response:
-        url = f"{self.base_url}/{endpoint.lstrip('/')}"
-        self._log_request("PUT", url, json=json, **kwargs)
-        response = self.session.put(url, json=json, timeout=self.timeout, **kwargs)
-        self._log_response(response)
-        return response
+        return self._request("PUT", endpoint, json=json, **kwargs)
 
     def delete(self, endpoint: str, **kwargs) -> requests.Response:
-        url = f"{self.base_url}/{endpoint.lstrip('/')}"
-        self._log_request("DELETE", url, **kwargs)
-        response = self.session.delete(url, timeout=self.timeout, **kwargs)
-        self._log_response(response)
-        return response
+        return self._request("DELETE", endpoint, **kwargs)
 
     def close(self):
+        if self._hedge_executor is not None:
+            self._hedge_executor.shutdown(wait=False, cancel_futures=True)
         self.session.close()
 
 
+def _close_response(future: Future):
+    if not future.cancelled() and future.exception() is None and future.result().raw is not None:
+        future.result().close()
+
+
 class JSONPlaceholderClient(APIClient):
     def get_posts(self, user_id: Optional[int] = None) -> requests.Response:
         params = {"userId": user_id} if user_id else None
@@ -88,6 +182,24 @@ class JSONPlaceholderClient(APIClient):
     def delete_post(self, post_id: int) -> requests.Response:
         return self.delete(f"posts/{post_id}")
 
+    def create_posts(self, posts: Iterable[Dict[str, Any]],
+                     max_workers: Optional[int] = None) -> Iterator[BulkResult]:
+        def send(post, key):
+            return self.post("posts", json=post, headers={IDEMPOTENCY_HEADER: key})
+        return run_bulk(send, posts, max_workers or self.pool_size)
+
+    def update_posts(self, posts: Iterable[Dict[str, Any]],
+                     max_workers: Optional[int] = None) -> Iterator[BulkResult]:
+        def send(post, key):
+            return self.put(f"posts/{post['id']}", json=post, headers={IDEMPOTENCY_HEADER: key})
+        return run_bulk(send, posts, max_workers or self.pool_size)
+
+    def delete_posts(self, post_ids: Iterable[int],
+                     max_workers: Optional[int] = None) -> Iterator[BulkResult]:
+        def send(post_id, key):
+            return self.delete(f"posts/{post_id}", headers={IDEMPOTENCY_HEADER: key})
+        return run_bulk(send, post_ids, max_workers or self.pool_size)
+
     def get_post_comments(self, post_id: int) -> requests.Response:
         return self.get(f"posts/{post_id}/comments")
 
@@ -0,0 +1,116 @@
+import logging
+from collections import defaultdict
+from typing import Any, Dict, Iterable, List, Optional
+
+from .client import JSONPlaceholderClient
+
+Record = Dict[str, Any]
+
+COLLECTIONS = ("posts", "users", "comments")
+
+
+class DatasetSnapshot:
+    """Posts, users and comments loaded once and indexed for relationship checks."""
+
+    def __init__(self, client: JSONPlaceholderClient):
+        self.client = client
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.posts: List[Record] = []
+        self.users: List[Record] = []
+        self.comments: List[Record] = []
+        self.posts_by_id: Dict[int, Record] = {}
+        self.posts_by_user: Dict[int, List[Record]] = {}
+        self.users_by_id: Dict[int, Record] = {}
+        self.users_by_email: Dict[str, Record] = {}
+        self.comments_by_id: Dict[int, Record] = {}
+        self.comments_by_post: Dict[int, List[Record]] = {}
+        self.duplicate_ids: Dict[str, List[int]] = {name: [] for name in COLLECTIONS}
+
+    def load(self) -> "DatasetSnapshot":
+        return self.refresh(*COLLECTIONS)
+
+    def refresh(self, *collections: str) -> "DatasetSnapshot":
+        for name in collections or COLLECTIONS:
+            if name not in COLLECTIONS:
+                raise ValueError(f"Unknown collection: {name}")
+            response = self.client.get(name)
+            response.raise_for_status()
+            self.set_collection(name, response.json())
+        return self
+
+    def set_collection(self, name: str, records: List[Record]):
+        setattr(self, name, records)
+        getattr(self, f"_index_{name}")(records)
+        self.logger.info(f"Indexed {len(records)} {name}")
+
+    def _index_posts(self, posts: List[Record]):
+        by_user = defaultdict(list)
+        self.posts_by_id, self.duplicate_ids["posts"] = self._index_by_id(posts)
+        for post in posts:
+            by_user[post.get("userId")].append(post)
+        self.posts_by_user = dict(by_user)
+
+    def _index_users(self, users: List[Record]):
+        self.users_by_id, self.duplicate_ids["users"] = self._index_by_id(users)
+        self.users_by_email = {
+            u["email"].lower(): u for u in users if isinstance(u.get("email"), str)
+        }
+
+    def _index_comments(self, comments: List[Record]):
+        by_post = defaultdict(list)
+        self.comments_by_id, self.duplicate_ids["comments"] = self._index_by_id(comments)
+        for comment in comments:
+            by_post[comment.get("postId")].append(comment)
+        self.comments_by_post = dict(by_post)
+
+    @staticmethod
+    def _index_by_id(records: Iterable[Record]):
+        index: Dict[int, Record] = {}
+        duplicates: List[int] = []
+        for record in records:
+            record_id = record.get("id")
+            if record_id in index:
+                duplicates.append(record_id)
+            index[record_id] = record
+        return index, duplicates
+
+    def user(self, user_id: int) -> Optional[Record]:
+        return self.users_by_id.get(user_id)
+
+    def user_by_email(self, email: str) -> Optional[Record]:
+        return self.users_by_email.get(email.lower())
+
+    def post(self, post_id: int) -> Optional[Record]:
+        return self.posts_by_id.get(post_id)
+
+    def posts_for_user(self, user_id: int) -> List[Record]:
+        return self.posts_by_user.get(user_id, [])
+
+    def comments_for_post(self, post_id: int) -> List[Record]:
+        return self.comments_by_post.get(post_id, [])
+
+    def post_counts_by_user(self) -> Dict[int, int]:
+        return {user_id: len(posts) for user_id, posts in self.posts_by_user.items()}
+
+    def comment_counts_by_post(self) -> Dict[int, int]:
+        return {post_id: len(comments) for post_id, comments in self.comments_by_post.items()}
+
+    def orphan_posts(self) -> List[Record]:
+        return [p for p in self.posts if p.get("userId") not in self.users_by_id]
+
+    def orphan_comments(self) -> List[Record]:
+        return [c for c in self.comments if c.get("postId") not in self.posts_by_id]
+
+    def integrity_errors(self) -> List[Dict[str, Any]]:
+        errors = []
+        for name, ids in self.duplicate_ids.items():
+            errors.extend({"collection": name, "id": i, "issue": "duplicate id"} for i in ids)
+        errors.extend(
+            {"collection": "posts", "id": p.get("id"), "issue": f"unknown userId {p.get('userId')}"}
+            for p in self.orphan_posts()
+        )
+        errors.extend(
+            {"collection": "comments", "id": c.get("id"), "issue": f"unknown postId {c.get('postId')}"}
+            for c in self.orphan_comments()
+        )
+        return errors
@@ -0,0 +1,8 @@
+import re
+
+_ID_SEGMENT = re.compile(r"/\d+(?=/|$)")
+
+
+def endpoint_template(path: str) -> str:
+    """Collapse numeric path segments: /posts/1/comments -> /posts/{id}/comments."""
+    return _ID_SEGMENT.sub("/{id}", path.rstrip("/")) or "/"
@@ -0,0 +1,64 @@
+import math
+import threading
+from collections import deque
+from typing import Optional
+
+
+class LatencyTracker:
+    """Rolling window of observed request latencies in seconds."""
+
+    def __init__(self, window: int = 200):
+        self._samples = deque(maxlen=window)
+        self._lock = threading.Lock()
+
+    def record(self, seconds: float):
+        with self._lock:
+            self._samples.append(seconds)
+
+    def __len__(self) -> int:
+        return len(self._samples)
+
+    def percentile(self, percentile: float) -> Optional[float]:
+        with self._lock:
+            samples = sorted(self._samples)
+        if not samples:
+            return None
+        rank = max(math.ceil(percentile / 100 * len(samples)) - 1, 0)
+        return samples[rank]
+
+
+class HedgePolicy:
+    """Decides when a slow GET gets a second, identical request.
+
+    The hedge delay is the given percentile of recent latencies, and hedges
+    are capped at max_ratio of all hedgeable requests so a slow backend is
+    not hit with double the load.
+    """
+
+    def __init__(self, percentile: float = 95, max_ratio: float = 0.1,
+                 min_delay: float = 0.05, min_samples: int = 20, window: int = 200):
+        self.percentile = percentile
+        self.max_ratio = max_ratio
+        self.min_delay = min_delay
+        self.min_samples = min_samples
+        self.latencies = LatencyTracker(window)
+        self.requests = 0
+        self.hedges = 0
+        self._lock = threading.Lock()
+
+    def delay(self) -> Optional[float]:
+        """Seconds to wait before hedging, or None while there is too little data."""
+        if len(self.latencies) < self.min_samples:
+            return None
+        return max(self.latencies.percentile(self.percentile), self.min_delay)
+
+    def record_request(self):
+        with self._lock:
+            self.requests += 1
+
+    def try_hedge(self) -> bool:
+        with self._lock:
+            if self.hedges + 1 > self.max_ratio * self.requests:
+                return False
+            self.hedges += 1
+            return True
@@ -0,0 +1,163 @@
+import logging
+import os
+import ssl
+import threading
+from typing import Dict, Optional, Tuple
+
+import requests
+from requests.adapters import BaseAdapter, HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers, select_proxy
+from urllib3.exceptions import MaxRetryError
+from urllib3.response import HTTPResponse
+from urllib3.util.retry import Retry
+
+try:
+    import httpx
+    import h2  # noqa: F401  (httpx needs it for http2=True)
+except ImportError:  # httpx[http2] is an optional dependency
+    httpx = None
+
+logger = logging.getLogger(__name__)
+
+
+def http2_available() -> bool:
+    return httpx is not None
+
+
+class HTTP2Adapter(BaseAdapter):
+    """requests adapter that sends through shared HTTP/2 httpx clients.
+
+    Concurrent requests to the same host are multiplexed as streams over one
+    connection. Servers that do not negotiate h2 via ALPN are spoken to over
+    HTTP/1.1 by the same client.
+
+    Status retries follow urllib3: the Retry object is incremented per retry,
+    backoff and Retry-After come from Retry.sleep, and running out raises
+    RetryError when raise_on_status is set. verify, cert and proxies get their
+    own httpx client; stream=True is not supported. A custom `transport`
+    (e.g. httpx.MockTransport) replaces the network and with it TLS and proxies.
+    """
+
+    def __init__(self, max_retries: Optional[Retry] = None,
+                 transport: Optional["httpx.BaseTransport"] = None):
+        super().__init__()
+        if not http2_available():
+            raise ImportError("HTTP/2 transport requires httpx[http2]: pip install 'httpx[http2]'")
+        self.max_retries = Retry.from_int(max_retries) if max_retries is not None else Retry(0, read=False)
+        self.transport = transport
+        self._clients: Dict[Tuple, "httpx.Client"] = {}
+        self._lock = threading.Lock()
+
+    def _create_client(self, verify, cert, proxy) -> "httpx.Client":
+        transport = self.transport or httpx.HTTPTransport(
+            http2=True, retries=self.max_retries.total or 0,
+            verify=self._ssl_context(verify, cert), proxy=proxy
+        )
+        # requests already resolved proxies and CA bundles from the environment
+        return httpx.Client(http2=True, transport=transport, trust_env=False)
+
+    @staticmethod
+    def _ssl_context(verify, cert):
+        if verify is False:
+            if cert is None:
+                return False
+            context = ssl.create_default_context()
+            context.check_hostname = False
+            context.verify_mode = ssl.CERT_NONE
+        elif isinstance(verify, str):
+            if os.path.isdir(verify):
+                context = ssl.create_default_context(capath=verify)
+            else:
+                context = ssl.create_default_context(cafile=verify)
+        elif cert is None:
+            return True
+        else:
+            context = ssl.create_default_context()
+        if cert is not None:
+            certfile, keyfile = cert if isinstance(cert, tuple) else (cert, None)
+            context.load_cert_chain(certfile, keyfile)
+        return context
+
+    def _client_for(self, url: str, verify, cert, proxies) -> "httpx.Client":
+        proxy = select_proxy(url, proxies) if proxies else None
+        key = (verify, cert, proxy)
+        with self._lock:
+            if key not in self._clients:
+                self._clients[key] = self._create_client(verify, cert, proxy)
+            return self._clients[key]
+
+    def send(self, request: requests.PreparedRequest, stream=False, timeout=None,
+             verify=True, cert=None, proxies=None) -> requests.Response:
+        if stream:
+            raise NotImplementedError("HTTP2Adapter reads bodies eagerly and does not support stream=True")
+        client = self._client_for(request.url, verify, cert, proxies)
+        retries = self.max_retries
+        while True:
+            response = self._send_once(client, request, timeout)
+            has_retry_after = "Retry-After" in response.headers
+            if not retries.is_retry(request.method, response.status_code, has_retry_after):
+                return response
+            raw = HTTPResponse(
+                headers=dict(response.headers), status=response.status_code, preload_content=False,
+                request_method=request.method, request_url=request.url
+            )
+            try:
+                retries = retries.increment(method=request.method, url=request.url, response=raw)
+            except MaxRetryError as e:
+                if retries.raise_on_status:
+                    raise requests.exceptions.RetryError(e, request=request) from e
+                return response
+            logger.debug(f"Retrying {request.method} {request.url} after {response.status_code}: {retries}")
+            retries.sleep(raw)
+
+    def _send_once(self, client: "httpx.Client", request: requests.PreparedRequest,
+                   timeout) -> requests.Response:
+        try:
+            raw = client.request(
+                request.method,
+                request.url,
+                headers=dict(request.headers),
+                content=request.body,
+                timeout=self._timeout(timeout),
+            )
+        except httpx.TimeoutException as e:
+            exc = requests.exceptions.ConnectTimeout if isinstance(e, httpx.ConnectTimeout) else requests.exceptions.ReadTimeout
+            raise exc(e, request=request) from e
+        except httpx.TransportError as e:
+            raise requests.exceptions.ConnectionError(e, request=request) from e
+        return self._build_response(request, raw)
+
+    @staticmethod
+    def _timeout(timeout) -> "httpx.Timeout":
+        if isinstance(timeout, tuple):
+            connect, read = timeout
+            return httpx.Timeout(read, connect=connect)
+        return httpx.Timeout(timeout)
+
+    def _build_response(self, request: requests.PreparedRequest, raw: "httpx.Response") -> requests.Response:
+        response = requests.Response()
+        response.status_code = raw.status_code
+        response.headers = CaseInsensitiveDict(raw.headers)
+        response.encoding = get_encoding_from_headers(response.headers)
+        response.reason = raw.reason_phrase
+        response.url = str(raw.url)
+        response._content = raw.content
+        response.request = request
+        response.connection = self
+        response.http_version = raw.http_version
+        return response
+
+    def close(self):
+        with self._lock:
+            clients, self._clients = list(self._clients.values()), {}
+        for client in clients:
+            client.close()
+
+
+def create_http2_adapter(max_retries: Optional[Retry] = None) -> BaseAdapter:
+    """Return an HTTP/2 adapter, or a plain HTTP/1.1 adapter when httpx[http2] is missing."""
+    if http2_available():
+        return HTTP2Adapter(max_retries=max_retries)
+    logger.warning("httpx[http2] is not installed, falling back to HTTP/1.1")
+    return HTTPAdapter(max_retries=max_retries)
@@ -8,6 +8,16 @@ class APIConfig:
     TIMEOUT: int = int(os.getenv("API_TIMEOUT", "10"))
     MAX_RETRIES: int = int(os.getenv("API_MAX_RETRIES", "3"))
     RETRY_BACKOFF: int = int(os.getenv("API_RETRY_BACKOFF", "1"))
+    POOL_SIZE: int = int(os.getenv("API_POOL_SIZE", "10"))
+    HTTP2: bool = os.getenv("API_HTTP2", "false").lower() == "true"
+    HEDGE_ENABLED: bool = os.getenv("API_HEDGE_ENABLED", "false").lower() == "true"
+    HEDGE_PERCENTILE: float = float(os.getenv("API_HEDGE_PERCENTILE", "95"))
+    HEDGE_MAX_RATIO: float = float(os.getenv("API_HEDGE_MAX_RATIO", "0.1"))
+    CIRCUIT_BREAKER_ENABLED: bool = os.getenv("API_CIRCUIT_BREAKER_ENABLED", "true").lower() == "true"
+    CIRCUIT_FAILURE_RATE: float = float(os.getenv("API_CIRCUIT_FAILURE_RATE", "0.5"))
+    CIRCUIT_SLOW_CALL_SECONDS: float = float(os.getenv("API_CIRCUIT_SLOW_CALL_SECONDS", "5"))
+    CIRCUIT_MIN_CALLS: int = int(os.getenv("API_CIRCUIT_MIN_CALLS", "5"))
+    CIRCUIT_OPEN_SECONDS: float = float(os.getenv("API_CIRCUIT_OPEN_SECONDS", "30"))
 
 
 @dataclass
@@ -15,6 +25,10 @@ class TestConfig:
     LOG_LEVEL: str = os.getenv("LOG_LEVEL", "INFO")
     LOG_DIR: str = os.getenv("LOG_DIR", "logs")
     ALLURE_RESULTS_DIR: str = os.getenv("ALLURE_RESULTS_DIR", "allure-results")
+    CONTRACT_SNAPSHOT_DIR: str = os.getenv("CONTRACT_SNAPSHOT_DIR", ".contract-snapshots")
+    CONTRACT_SNAPSHOT_PERSIST: bool = os.getenv("CONTRACT_SNAPSHOT_PERSIST", "false").lower() == "true"
+    PROFILE_DIR: str = os.getenv("PROFILE_DIR", "profiles")
+    ATTACHMENT_MAX_BYTES: int = int(os.getenv("ATTACHMENT_MAX_BYTES", "65536"))
     PARALLEL_ENABLED: bool = os.getenv("PARALLEL_ENABLED", "false").lower() == "true"
     PARALLEL_WORKERS: int = int(os.getenv("PARALLEL_WORKERS", "4"))
 
@@ -1,13 +1,35 @@
-from .schemas import (
-    Post, PostCreate, PostList,
-    User, UserList,
-    Comment, CommentList,
-    Address, GeoLocation, Company
-)
+from importlib import import_module
 
 __all__ = [
     'Post', 'PostCreate', 'PostList',
     'User', 'UserList',
     'Comment', 'CommentList',
-    'Address', 'GeoLocation', 'Company'
-]
\ No newline at end of file
+    'Address', 'GeoLocation', 'Company',
+    'CachedEmailStr', 'validate_emails',
+    'ColumnarDataset', 'load_columnar',
+    'CollectionSnapshot', 'ContractSnapshotStore', 'SnapshotDiff', 'validate_changed'
+]
+
+_LAZY_ATTRS = {
+    'Post': '.schemas', 'PostCreate': '.schemas', 'PostList': '.schemas',
+    'User': '.schemas', 'UserList': '.schemas',
+    'Comment': '.schemas', 'CommentList': '.schemas',
+    'Address': '.schemas', 'GeoLocation': '.schemas', 'Company': '.schemas',
+    'CachedEmailStr': '.schemas', 'validate_emails': '.schemas',
+    'ColumnarDataset': '.columnar', 'load_columnar': '.columnar',
+    'CollectionSnapshot': '.snapshots', 'ContractSnapshotStore': '.snapshots',
+    'SnapshotDiff': '.snapshots', 'validate_changed': '.snapshots',
+}
+
+
+def __getattr__(name):
+    # pydantic, email_validator and numpy are imported on first attribute access.
+    if name in _LAZY_ATTRS:
+        value = getattr(import_module(_LAZY_ATTRS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
\ No newline at end of file
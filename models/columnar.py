@@ -0,0 +1,171 @@
+import re
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Pattern, Union
+
+if TYPE_CHECKING:
+    import numpy as np
+else:
+    np = None  # numpy is optional and imported on first use, see _require_numpy
+
+Record = Dict[str, Any]
+
+
+def _require_numpy():
+    global np
+    if np is None:
+        try:
+            import numpy
+        except ImportError:
+            raise ImportError("numpy is required for columnar datasets: pip install numpy") from None
+        np = numpy
+    return np
+
+
+class IntColumn:
+    """Integer field stored as an int64 array plus a validity mask."""
+
+    def __init__(self, values: "np.ndarray", valid: "np.ndarray"):
+        self.values = values
+        self.valid = valid
+
+    @classmethod
+    def from_values(cls, values: List[Any]) -> "IntColumn":
+        _require_numpy()
+        valid = np.fromiter((type(v) is int for v in values), dtype=bool, count=len(values))
+        data = np.fromiter(
+            (v if type(v) is int else 0 for v in values), dtype=np.int64, count=len(values)
+        )
+        return cls(data, valid)
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def is_null(self) -> "np.ndarray":
+        return ~self.valid
+
+    def duplicated(self) -> "np.ndarray":
+        values = self.values[self.valid]
+        uniques, counts = np.unique(values, return_counts=True)
+        return uniques[counts > 1]
+
+    def is_unique(self) -> bool:
+        return self.duplicated().size == 0
+
+    def out_of_range(self, low: Optional[int] = None, high: Optional[int] = None) -> "np.ndarray":
+        mask = np.zeros(len(self), dtype=bool)
+        if low is not None:
+            mask |= self.values < low
+        if high is not None:
+            mask |= self.values > high
+        return mask & self.valid
+
+    def not_in(self, other: Union["IntColumn", Iterable[int]]) -> "np.ndarray":
+        keys = other.values[other.valid] if isinstance(other, IntColumn) else np.asarray(list(other))
+        return ~np.isin(self.values, keys) & self.valid
+
+    def not_equal(self, value: int) -> "np.ndarray":
+        return (self.values != value) | ~self.valid
+
+
+class StringColumn:
+    """String field stored as interned codes into a table of unique values."""
+
+    def __init__(self, codes: "np.ndarray", categories: List[str]):
+        self.codes = codes
+        self.categories = categories
+
+    @classmethod
+    def from_values(cls, values: List[Any]) -> "StringColumn":
+        _require_numpy()
+        index: Dict[str, int] = {}
+        codes = np.fromiter(
+            (index.setdefault(v, len(index)) if type(v) is str else -1 for v in values),
+            dtype=np.int32,
+            count=len(values),
+        )
+        return cls(codes, list(index))
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    def _map_categories(self, flags: List[bool], default: bool) -> "np.ndarray":
+        # Evaluate once per unique string, then broadcast through the codes.
+        table = np.append(np.array(flags, dtype=bool), default)
+        return table[self.codes]
+
+    def is_null(self) -> "np.ndarray":
+        return self.codes < 0
+
+    def is_blank(self) -> "np.ndarray":
+        return self._map_categories([not c.strip() for c in self.categories], True)
+
+    def not_matching(self, pattern: Union[str, Pattern]) -> "np.ndarray":
+        regex = re.compile(pattern) if isinstance(pattern, str) else pattern
+        return self._map_categories([not regex.match(c) for c in self.categories], True)
+
+    def duplicated(self) -> List[str]:
+        codes = self.codes[self.codes >= 0]
+        counts = np.bincount(codes, minlength=len(self.categories))
+        return [self.categories[i] for i in np.flatnonzero(counts > 1)]
+
+    def is_unique(self) -> bool:
+        return not self.duplicated()
+
+    def to_list(self) -> List[Optional[str]]:
+        return [self.categories[c] if c >= 0 else None for c in self.codes]
+
+
+class ColumnarDataset:
+    """Column-oriented view of a list endpoint for whole-collection assertions."""
+
+    def __init__(self, columns: Dict[str, Union[IntColumn, StringColumn]], length: int):
+        self.columns = columns
+        self.length = length
+
+    @classmethod
+    def from_records(cls, records: List[Record], fields: Optional[Dict[str, type]] = None) -> "ColumnarDataset":
+        _require_numpy()
+        if fields is None:
+            if not records:
+                raise ValueError("Cannot infer columns from an empty list, pass fields explicitly")
+            fields = {k: type(v) for k, v in records[0].items() if type(v) in (int, str)}
+
+        columns = {}
+        for name, field_type in fields.items():
+            values = [r.get(name) for r in records]
+            if field_type is int:
+                columns[name] = IntColumn.from_values(values)
+            elif field_type is str:
+                columns[name] = StringColumn.from_values(values)
+            else:
+                raise TypeError(f"Unsupported column type for {name}: {field_type!r}")
+        return cls(columns, len(records))
+
+    def __len__(self) -> int:
+        return self.length
+
+    def __getitem__(self, name: str) -> Union[IntColumn, StringColumn]:
+        return self.columns[name]
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.columns
+
+    def null_or_blank(self, *names: str) -> Dict[str, "np.ndarray"]:
+        result = {}
+        for name in names or tuple(self.columns):
+            column = self.columns[name]
+            mask = column.is_blank() if isinstance(column, StringColumn) else column.is_null()
+            if mask.any():
+                result[name] = np.flatnonzero(mask)
+        return result
+
+    def rows(self, mask: "np.ndarray", key: str = "id") -> List[Any]:
+        """Return key values (ids by default) for the rows selected by mask."""
+        column = self.columns[key]
+        selected = np.flatnonzero(mask)
+        if isinstance(column, IntColumn):
+            return column.values[selected].tolist()
+        return [column.categories[c] if c >= 0 else None for c in column.codes[selected]]
+
+
+def load_columnar(records: List[Record], fields: Optional[Dict[str, type]] = None) -> ColumnarDataset:
+    return ColumnarDataset.from_records(records, fields)
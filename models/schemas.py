@@ -1,26 +1,75 @@
-from typing import List
-from pydantic import BaseModel, EmailStr, Field, validator
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from typing_extensions import Annotated
+from pydantic import AfterValidator, BaseModel, ConfigDict, Field, WithJsonSchema, validator
+from pydantic.networks import validate_email
+from pydantic_core import PydanticCustomError
 
+EMAIL_CACHE_SIZE = 65536
 
-class Post(BaseModel):
+
+@lru_cache(maxsize=EMAIL_CACHE_SIZE)
+def _check_email(value: str) -> Tuple[Optional[str], Optional[Tuple[str, str, Dict[str, Any]]]]:
+    # Same syntax-only check as EmailStr (no DNS); errors are cached as data so
+    # identical addresses are validated once and each caller gets a fresh exception.
+    try:
+        return validate_email(value)[1], None
+    except PydanticCustomError as e:
+        return None, (e.type, e.message_template, e.context or {})
+
+
+def validate_emails(emails: Iterable[Any]) -> Dict[int, str]:
+    """Validate a column of addresses at once, returning {index: error} for invalid ones."""
+    errors = {}
+    for index, email in enumerate(emails):
+        if not isinstance(email, str):
+            errors[index] = "Input should be a valid string"
+            continue
+        _, error = _check_email(email)
+        if error:
+            errors[index] = PydanticCustomError(*error).message()
+    return errors
+
+
+def _validate_cached_email(value: str) -> str:
+    email, error = _check_email(value)
+    if error:
+        raise PydanticCustomError(*error)
+    return email
+
+
+# EmailStr semantics with validation of repeated addresses memoized.
+CachedEmailStr = Annotated[
+    str,
+    AfterValidator(_validate_cached_email),
+    WithJsonSchema({"type": "string", "format": "email"}),
+]
+
+
+class Schema(BaseModel):
+    # Core schemas (and the email_validator import) are built on first use.
+    model_config = ConfigDict(defer_build=True)
+
+
+class Post(Schema):
     userId: int = Field(..., gt=0)
     id: int = Field(..., gt=0)
     title: str = Field(..., min_length=1)
     body: str = Field(..., min_length=1)
 
 
-class PostCreate(BaseModel):
+class PostCreate(Schema):
     title: str = Field(..., min_length=1)
     body: str = Field(..., min_length=1)
     userId: int = Field(..., gt=0)
 
 
-class GeoLocation(BaseModel):
+class GeoLocation(Schema):
     lat: str
     lng: str
 
 
-class Address(BaseModel):
+class Address(Schema):
     street: str
     suite: str
     city: str
@@ -28,17 +77,17 @@ class Address(BaseModel):
     geo: GeoLocation
 
 
-class Company(BaseModel):
+class Company(Schema):
     name: str
     catchPhrase: str
     bs: str
 
 
-class User(BaseModel):
+class User(Schema):
     id: int = Field(..., gt=0)
     name: str = Field(..., min_length=1)
     username: str = Field(..., min_length=1)
-    email: EmailStr
+    email: CachedEmailStr
     address: Address
     phone: str
     website: str
@@ -51,11 +100,11 @@ class User(BaseModel):
         return v
 
 
-class Comment(BaseModel):
+class Comment(Schema):
     postId: int = Field(..., gt=0)
     id: int = Field(..., gt=0)
     name: str = Field(..., min_length=1)
-    email: EmailStr
+    email: CachedEmailStr
     body: str = Field(..., min_length=1)
 
 
@@ -0,0 +1,182 @@
+import hashlib
+import json
+import zlib
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Type
+
+from pydantic import BaseModel, ValidationError
+
+from config.config import test_config
+
+Record = Dict[str, Any]
+
+EMPTY_HASH = hashlib.sha256(b"").hexdigest()
+
+
+def record_hash(record: Record) -> str:
+    payload = json.dumps(record, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def schema_fingerprint(model: Type[BaseModel]) -> str:
+    schema = json.dumps(model.model_json_schema(), sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(schema.encode("utf-8")).hexdigest()
+
+
+def _combine(*hashes: str) -> str:
+    return hashlib.sha256("".join(hashes).encode("utf-8")).hexdigest()
+
+
+@dataclass
+class SnapshotDiff:
+    added: List[str] = field(default_factory=list)
+    changed: List[str] = field(default_factory=list)
+    removed: List[str] = field(default_factory=list)
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.changed or self.removed)
+
+    @property
+    def touched(self) -> List[str]:
+        """Keys whose new content has to be validated."""
+        return self.added + self.changed
+
+
+class CollectionSnapshot:
+    """Per-record content hashes of one collection plus a Merkle tree over them.
+
+    Records are spread over a fixed number of buckets (a power of two), each
+    bucket hash covers its records, and the tree is built over the buckets.
+    Two snapshots are compared top-down, so only subtrees whose hashes differ
+    are visited and only the records of differing buckets are compared.
+
+    `schema` is the fingerprint of the model the records were validated
+    against; when it differs between two snapshots every record counts as
+    changed, since unchanged records may not satisfy the new contract.
+    """
+
+    def __init__(self, hashes: Dict[str, str], buckets: int = 256, schema: Optional[str] = None):
+        if buckets & (buckets - 1):
+            raise ValueError("buckets must be a power of two")
+        self.hashes = hashes
+        self.buckets = buckets
+        self.schema = schema
+        self._members: List[List[str]] = [[] for _ in range(buckets)]
+        for key in hashes:
+            self._members[self._bucket(key)].append(key)
+        self.levels = self._build_tree()
+
+    @classmethod
+    def from_records(cls, records: List[Record], key: str = "id", buckets: int = 256,
+                     schema: Optional[str] = None) -> "CollectionSnapshot":
+        return cls({str(r[key]): record_hash(r) for r in records}, buckets, schema)
+
+    def _bucket(self, key: str) -> int:
+        return zlib.crc32(key.encode("utf-8")) & (self.buckets - 1)
+
+    def _build_tree(self) -> List[List[str]]:
+        leaves = [
+            _combine(*(f"{k}:{self.hashes[k]}" for k in sorted(keys))) if keys else EMPTY_HASH
+            for keys in self._members
+        ]
+        levels = [leaves]
+        while len(levels[-1]) > 1:
+            below = levels[-1]
+            levels.append([_combine(below[i], below[i + 1]) for i in range(0, len(below), 2)])
+        return levels
+
+    @property
+    def root(self) -> str:
+        return self.levels[-1][0]
+
+    def diff(self, new: "CollectionSnapshot") -> SnapshotDiff:
+        """Changes going from this (stored) snapshot to `new`."""
+        if new.schema != self.schema:
+            return self._diff_keys(new, set(self.hashes) | set(new.hashes), all_changed=True)
+        if new.buckets != self.buckets:
+            return self._diff_keys(new, set(self.hashes) | set(new.hashes))
+
+        result = SnapshotDiff()
+        top = len(self.levels) - 1
+        stack = [(top, 0)]
+        while stack:
+            level, index = stack.pop()
+            if self.levels[level][index] == new.levels[level][index]:
+                continue
+            if level == 0:
+                keys = set(self._members[index]) | set(new._members[index])
+                partial = self._diff_keys(new, keys)
+                result.added += partial.added
+                result.changed += partial.changed
+                result.removed += partial.removed
+            else:
+                stack.extend(((level - 1, 2 * index), (level - 1, 2 * index + 1)))
+        return result
+
+    def _diff_keys(self, new: "CollectionSnapshot", keys, all_changed: bool = False) -> SnapshotDiff:
+        result = SnapshotDiff()
+        for key in sorted(keys):
+            old_hash, new_hash = self.hashes.get(key), new.hashes.get(key)
+            if old_hash is None:
+                result.added.append(key)
+            elif new_hash is None:
+                result.removed.append(key)
+            elif all_changed or old_hash != new_hash:
+                result.changed.append(key)
+        return result
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"buckets": self.buckets, "schema": self.schema, "root": self.root, "hashes": self.hashes}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "CollectionSnapshot":
+        return cls(data["hashes"], data["buckets"], data.get("schema"))
+
+
+class ContractSnapshotStore:
+    """Stores collection snapshots as JSON files between runs."""
+
+    def __init__(self, directory: str = test_config.CONTRACT_SNAPSHOT_DIR, buckets: int = 256):
+        self.directory = Path(directory)
+        self.buckets = buckets
+
+    def _path(self, collection: str) -> Path:
+        return self.directory / f"{collection}.json"
+
+    def load(self, collection: str) -> Optional[CollectionSnapshot]:
+        path = self._path(collection)
+        if not path.exists():
+            return None
+        return CollectionSnapshot.from_dict(json.loads(path.read_text(encoding="utf-8")))
+
+    def save(self, collection: str, snapshot: CollectionSnapshot):
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._path(collection).write_text(json.dumps(snapshot.to_dict()), encoding="utf-8")
+
+    def compare(self, collection: str, records: List[Record], key: str = "id",
+                model: Optional[Type[BaseModel]] = None):
+        """Return (diff against the stored snapshot, new snapshot); everything is added on the first run.
+
+        Pass the contract `model` so a schema change re-validates every record.
+        """
+        schema = schema_fingerprint(model) if model is not None else None
+        new = CollectionSnapshot.from_records(records, key, self.buckets, schema)
+        old = self.load(collection) or CollectionSnapshot({}, self.buckets, schema)
+        return old.diff(new), new
+
+
+def validate_changed(records: List[Record], diff: SnapshotDiff, model: Type[BaseModel],
+                     key: str = "id") -> Dict[str, str]:
+    """Validate only added and changed records, returning {key: error}."""
+    touched = set(diff.touched)
+    errors = {}
+    for record in records:
+        record_key = str(record.get(key))
+        if record_key not in touched:
+            continue
+        try:
+            model(**record)
+        except ValidationError as e:
+            errors[record_key] = str(e)
+    return errors
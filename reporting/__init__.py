@@ -0,0 +1,22 @@
+from importlib import import_module
+
+__all__ = ['AttachmentWriter', 'attach', 'attachment_writer', 'ProfileCollector']
+
+_LAZY_ATTRS = {
+    'AttachmentWriter': '.attachments',
+    'attach': '.attachments',
+    'attachment_writer': '.attachments',
+    'ProfileCollector': '.profiling',
+}
+
+
+def __getattr__(name):
+    if name in _LAZY_ATTRS:
+        value = getattr(import_module(_LAZY_ATTRS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
\ No newline at end of file
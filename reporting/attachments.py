@@ -0,0 +1,112 @@
+import hashlib
+import logging
+import queue
+import threading
+from typing import Any, Optional, Set, Tuple, Type
+
+import allure
+import allure_commons
+
+from config.config import test_config
+
+TRUNCATION_MARKER = "\n... [truncated {size} bytes]"
+
+
+class AttachmentWriter:
+    """Writes Allure attachments from a background thread.
+
+    The attachment entry is registered on the current test or step right away,
+    while the body is written to the results directory by a worker thread.
+    Identical payloads share one file, keyed by their content hash.
+
+    By default entries go to the active allure-pytest reporter and bodies to
+    every registered Allure logger; pass `reporter` and `file_logger` (e.g.
+    an AllureFileLogger) to route them elsewhere.
+    """
+
+    def __init__(self, max_bytes: int = test_config.ATTACHMENT_MAX_BYTES,
+                 skip_types: Tuple[Type, ...] = (), reporter=None, file_logger=None):
+        self.max_bytes = max_bytes
+        self.skip_types = skip_types
+        self.reporter = reporter
+        self.file_logger = file_logger
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self._queue: "queue.Queue[Optional[Tuple[bytes, str]]]" = queue.Queue()
+        self._written: Set[str] = set()
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+
+    def _reporter(self):
+        if self.reporter is not None:
+            return self.reporter
+        for plugin in allure_commons.plugin_manager.get_plugins():
+            reporter = getattr(plugin, "allure_logger", None)
+            if reporter is not None:
+                return reporter
+        return None
+
+    def should_skip(self, value: Any) -> bool:
+        return isinstance(value, self.skip_types)
+
+    def attach(self, body: Any, name: Optional[str] = None,
+               attachment_type=allure.attachment_type.TEXT):
+        reporter = self._reporter()
+        if reporter is None or self.should_skip(body):
+            return
+
+        data = self._truncate(body if isinstance(body, bytes) else str(body).encode("utf-8"))
+        digest = hashlib.sha1(data).hexdigest()
+        file_name = reporter._attach(digest, name=name, attachment_type=attachment_type)
+
+        with self._lock:
+            if file_name in self._written:
+                return
+            self._written.add(file_name)
+            self._ensure_worker()
+        self._queue.put((data, file_name))
+
+    def _truncate(self, data: bytes) -> bytes:
+        if not self.max_bytes or len(data) <= self.max_bytes:
+            return data
+        marker = TRUNCATION_MARKER.format(size=len(data) - self.max_bytes).encode("utf-8")
+        return data[:self.max_bytes] + marker
+
+    def _ensure_worker(self):
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(target=self._run, name="allure-attachments", daemon=True)
+            self._thread.start()
+
+    def _run(self):
+        while True:
+            item = self._queue.get()
+            try:
+                if item is None:
+                    return
+                data, file_name = item
+                self._write(data, file_name)
+            except Exception:
+                self.logger.exception("Failed to write attachment")
+            finally:
+                self._queue.task_done()
+
+    def _write(self, data: bytes, file_name: str):
+        if self.file_logger is not None:
+            self.file_logger.report_attached_data(body=data, file_name=file_name)
+        else:
+            allure_commons.plugin_manager.hook.report_attached_data(body=data, file_name=file_name)
+
+    def flush(self):
+        if self._thread is not None and self._thread.is_alive():
+            self._queue.join()
+
+    def close(self):
+        with self._lock:
+            thread, self._thread = self._thread, None
+        if thread is not None and thread.is_alive():
+            self._queue.put(None)
+            thread.join()
+        self._written.clear()
+
+
+attachment_writer = AttachmentWriter()
+attach = attachment_writer.attach
@@ -0,0 +1,161 @@
+import re
+import sys
+import threading
+import time
+import tracemalloc
+from collections import Counter
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from api_client.endpoints import endpoint_template
+
+
+@dataclass
+class ProfileResult:
+    nodeid: str
+    wall: float = 0.0
+    cpu: float = 0.0
+    network_wait: float = 0.0
+    requests: int = 0
+    peak_bytes: int = 0
+    stacks: Counter = field(default_factory=Counter)
+
+    @property
+    def other_wait(self) -> float:
+        """Wall time that is neither CPU on the test thread nor network wait (sleeps, locks, ...)."""
+        return max(self.wall - self.cpu - self.network_wait, 0.0)
+
+
+class StackSampler:
+    """Samples the stack of one thread at a fixed interval into collapsed-stack counts."""
+
+    def __init__(self, interval: float = 0.005):
+        self.interval = interval
+        self._target: Optional[int] = None
+        self._stacks: Optional[Counter] = None
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self):
+        self._thread = threading.Thread(target=self._run, name="stack-sampler", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+
+    def attach(self, thread_id: int, stacks: Counter):
+        self._stacks, self._target = stacks, thread_id
+
+    def detach(self):
+        self._target = self._stacks = None
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            target, stacks = self._target, self._stacks
+            if target is None or stacks is None:
+                continue
+            frame = sys._current_frames().get(target)
+            if frame is not None:
+                stacks[self._collapse(frame)] += 1
+
+    @staticmethod
+    def _collapse(frame) -> str:
+        names = []
+        while frame is not None:
+            module = frame.f_globals.get("__name__", "?")
+            names.append(f"{module}:{frame.f_code.co_name}")
+            frame = frame.f_back
+        return ";".join(reversed(names))
+
+
+class ProfileCollector:
+    """Per-test CPU, memory and network-wait profiling for the pytest session.
+
+    Each test gets a collapsed-stack file (flamegraph.pl / speedscope input)
+    in the output directory, and `summary_file` (summary.txt by default)
+    lists the slowest tests.
+    """
+
+    def __init__(self, output_dir: str = "profiles", interval: float = 0.005, top: int = 10,
+                 summary_file: str = "summary.txt"):
+        self.output_dir = Path(output_dir)
+        self.top = top
+        self.summary_file = summary_file
+        self.sampler = StackSampler(interval)
+        self.results: List[ProfileResult] = []
+        self.endpoints: Dict[str, List[float]] = {}
+        self._current: Optional[ProfileResult] = None
+        self._thread_id: Optional[int] = None
+        self._lock = threading.Lock()
+        self._owns_tracemalloc = False
+
+    def start(self):
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._owns_tracemalloc = True
+        self.sampler.start()
+
+    def stop(self):
+        self.sampler.stop()
+        if self._owns_tracemalloc:
+            tracemalloc.stop()
+
+    @contextmanager
+    def profile(self, nodeid: str):
+        result = ProfileResult(nodeid)
+        self._current, self._thread_id = result, threading.get_ident()
+        tracemalloc.reset_peak()
+        self.sampler.attach(self._thread_id, result.stacks)
+        wall, cpu = time.perf_counter(), time.thread_time()
+        try:
+            yield result
+        finally:
+            result.wall = time.perf_counter() - wall
+            result.cpu = time.thread_time() - cpu
+            result.peak_bytes = tracemalloc.get_traced_memory()[1]
+            self.sampler.detach()
+            self._current = self._thread_id = None
+            self.results.append(result)
+            self._write_stacks(result)
+
+    def record_request(self, method: str, url: str, wall: float, cpu: float):
+        """APIClient request observer: wall and CPU seconds spent in one call."""
+        with self._lock:
+            self.endpoints.setdefault(f"{method} {endpoint_template(url.split('?')[0])}", []).append(wall)
+        result = self._current
+        if result is not None and threading.get_ident() == self._thread_id:
+            result.requests += 1
+            result.network_wait += max(wall - cpu, 0.0)
+
+    def _write_stacks(self, result: ProfileResult):
+        if not result.stacks:
+            return
+        name = re.sub(r"[^\w.-]+", "_", result.nodeid).strip("_")
+        lines = (f"{stack} {count}" for stack, count in result.stacks.items())
+        (self.output_dir / f"{name}.folded").write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+    def summary(self) -> List[str]:
+        lines = [
+            f"{'wall':>8} {'cpu':>8} {'network':>8} {'other':>8} {'reqs':>5} {'peak MiB':>9}  test"
+        ]
+        for r in sorted(self.results, key=lambda r: r.wall, reverse=True)[:self.top]:
+            lines.append(
+                f"{r.wall:8.3f} {r.cpu:8.3f} {r.network_wait:8.3f} {r.other_wait:8.3f} "
+                f"{r.requests:5} {r.peak_bytes / 2 ** 20:9.2f}  {r.nodeid}"
+            )
+        if self.endpoints:
+            lines.append("")
+            lines.append(f"{'calls':>6} {'total':>8} {'max':>8}  endpoint")
+            for endpoint, times in sorted(self.endpoints.items(), key=lambda e: sum(e[1]), reverse=True)[:self.top]:
+                lines.append(f"{len(times):6} {sum(times):8.3f} {max(times):8.3f}  {endpoint}")
+        return lines
+
+    def write_summary(self) -> List[str]:
+        lines = self.summary()
+        (self.output_dir / self.summary_file).write_text("\n".join(lines) + "\n", encoding="utf-8")
+        return lines
@@ -1,10 +1,35 @@
 import logging
+import os
 import pytest
 import allure
 from pathlib import Path
+from typing import TYPE_CHECKING
+from urllib.parse import urlsplit
 
-from api_client.client import JSONPlaceholderClient
+from api_client.client import APIClient, JSONPlaceholderClient
+from api_client.dataset import DatasetSnapshot
 from config.config import api_config, test_config
+from reporting.attachments import attachment_writer
+
+if TYPE_CHECKING:
+    from api_client.circuit_breaker import CircuitBreakers
+    from reporting.profiling import ProfileCollector
+
+# Optional features (hedging, circuit breakers, profiling) are imported only
+# when enabled, so collection does not pay for them on every run.
+circuit_breakers_key = pytest.StashKey["CircuitBreakers"]()
+profiler_key = pytest.StashKey["ProfileCollector"]()
+
+
+def is_xdist_controller(config) -> bool:
+    return "PYTEST_XDIST_WORKER" not in os.environ and bool(config.getoption("numprocesses", None))
+
+
+def hedge_policy():
+    if not api_config.HEDGE_ENABLED:
+        return None
+    from api_client.hedging import HedgePolicy
+    return HedgePolicy(percentile=api_config.HEDGE_PERCENTILE, max_ratio=api_config.HEDGE_MAX_RATIO)
 
 
 def setup_logging():
@@ -21,14 +46,17 @@ def setup_logging():
     )
 
 
-setup_logging()
-
-
 @pytest.fixture(scope="session")
-def api_client():
+def api_client(request):
+    profiler = request.config.stash.get(profiler_key, None)
     client = JSONPlaceholderClient(
         base_url=api_config.BASE_URL,
-        timeout=api_config.TIMEOUT
+        timeout=api_config.TIMEOUT,
+        http2=api_config.HTTP2,
+        hedge=hedge_policy(),
+        circuit_breakers=request.config.stash.get(circuit_breakers_key, None),
+        pool_size=api_config.POOL_SIZE,
+        request_observer=profiler.record_request if profiler else None
     )
 
     logging.info(f"API Client created: {api_config.BASE_URL}")
@@ -37,6 +65,21 @@ def api_client():
     logging.info("API Client closed")
 
 
+@pytest.fixture(scope="session")
+def dataset(api_client):
+    return DatasetSnapshot(api_client).load()
+
+
+@pytest.fixture(autouse=True)
+def circuit_breaker_guard(request):
+    if not {"api_client", "dataset"} & set(request.fixturenames):
+        return
+    breakers = request.config.stash.get(circuit_breakers_key, None)
+    host = urlsplit(api_config.BASE_URL).netloc
+    if breakers is not None and host in breakers.open_circuits():
+        pytest.skip(f"Circuit open for {host}")
+
+
 @pytest.fixture(scope="function")
 def logger():
     return logging.getLogger("test")
@@ -68,23 +111,109 @@ def test_post_id():
     return 1
 
 
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_protocol(item, nextitem):
+    profiler = item.config.stash.get(profiler_key, None)
+    if profiler is None:
+        yield
+        return
+    with profiler.profile(item.nodeid):
+        yield
+
+
+def _is_circuit_open(excinfo) -> bool:
+    from api_client.circuit_breaker import CircuitOpenError
+    return excinfo.errisinstance(CircuitOpenError)
+
+
 @pytest.hookimpl(tryfirst=True, hookwrapper=True)
 def pytest_runtest_makereport(item, call):
     outcome = yield
     rep = outcome.get_result()
 
+    breakers = item.config.stash.get(circuit_breakers_key, None)
+    if breakers is not None and call.excinfo is not None and _is_circuit_open(call.excinfo):
+        path, lineno = item.reportinfo()[:2]
+        rep.outcome = "skipped"
+        rep.longrepr = (str(path), (lineno or 0) + 1, f"Skipped: {call.excinfo.value}")
+        return
+
     if rep.when == "call" and rep.failed:
         if hasattr(item, 'funcargs'):
             for key, value in item.funcargs.items():
                 if key != "request":
-                    allure.attach(
-                        str(value),
+                    attachment_writer.attach(
+                        value,
                         name=f"Fixture: {key}",
                         attachment_type=allure.attachment_type.TEXT
                     )
 
 
+def pytest_sessionfinish(session, exitstatus):
+    attachment_writer.close()
+    profiler = session.config.stash.get(profiler_key, None)
+    if profiler is not None:
+        profiler.stop()
+        profiler.write_summary()
+
+
+def pytest_terminal_summary(terminalreporter, exitstatus, config):
+    breakers = config.stash.get(circuit_breakers_key, None)
+    states = {}
+    if breakers is not None:
+        from api_client.circuit_breaker import CLOSED
+        states = {name: state for name, state in breakers.states().items() if state != CLOSED}
+    if states:
+        terminalreporter.section("circuit breakers")
+        for name, state in states.items():
+            terminalreporter.write_line(f"{state.upper():10} {name}")
+
+    if config.getoption("--profile-tests") and is_xdist_controller(config):
+        terminalreporter.section("profiling")
+        terminalreporter.write_line(
+            f"Per-worker summaries written to {config.getoption('--profile-dir')}/summary-gw*.txt"
+        )
+
+    profiler = config.stash.get(profiler_key, None)
+    if profiler is not None and profiler.results:
+        terminalreporter.section(f"slowest {profiler.top} tests (seconds)")
+        for line in profiler.summary():
+            terminalreporter.write_line(line)
+        terminalreporter.write_line(f"Collapsed stacks written to {profiler.output_dir}/")
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("profiling")
+    group.addoption("--profile-tests", action="store_true", default=False,
+                    help="sample CPU stacks and tracemalloc peaks per test")
+    group.addoption("--profile-dir", default=test_config.PROFILE_DIR,
+                    help="directory for collapsed-stack files and summary.txt")
+    group.addoption("--profile-top", type=int, default=10,
+                    help="number of slowest tests to report")
+
+
 def pytest_configure(config):
+    setup_logging()
+    if config.getoption("--profile-tests") and not is_xdist_controller(config):
+        from reporting.profiling import ProfileCollector
+        # Under xdist every worker profiles its own tests into its own summary.
+        worker = os.environ.get("PYTEST_XDIST_WORKER")
+        profiler = ProfileCollector(
+            config.getoption("--profile-dir"),
+            top=config.getoption("--profile-top"),
+            summary_file=f"summary-{worker}.txt" if worker else "summary.txt"
+        )
+        profiler.start()
+        config.stash[profiler_key] = profiler
+    if api_config.CIRCUIT_BREAKER_ENABLED:
+        from api_client.circuit_breaker import CircuitBreakers
+        config.stash[circuit_breakers_key] = CircuitBreakers(
+            failure_rate=api_config.CIRCUIT_FAILURE_RATE,
+            slow_call_seconds=api_config.CIRCUIT_SLOW_CALL_SECONDS,
+            min_calls=api_config.CIRCUIT_MIN_CALLS,
+            open_seconds=api_config.CIRCUIT_OPEN_SECONDS
+        )
+    attachment_writer.skip_types = (APIClient, DatasetSnapshot, logging.Logger)
     config.addinivalue_line("markers", "smoke: smoke tests")
     config.addinivalue_line("markers", "regression: regression tests")
     config.addinivalue_line("markers", "positive: positive scenarios")
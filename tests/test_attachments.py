@@ -0,0 +1,81 @@
+import pytest
+import allure
+from allure_commons.logger import AllureFileLogger
+
+from reporting.attachments import AttachmentWriter
+
+
+class RecordingReporter:
+    """Stands in for the allure-pytest reporter and records registered attachments."""
+
+    def __init__(self):
+        self.attachments = []
+
+    def _attach(self, uuid, name=None, attachment_type=None, extension=None, parent_uuid=None):
+        file_name = f"{uuid}-attachment.{attachment_type.extension}"
+        self.attachments.append((name, file_name))
+        return file_name
+
+
+@allure.feature("Reporting")
+@allure.story("Attachments")
+@allure.severity(allure.severity_level.MINOR)
+class TestAttachmentWriter:
+
+    @pytest.fixture
+    def reporter(self):
+        return RecordingReporter()
+
+    @pytest.fixture
+    def writer_factory(self, reporter, tmp_path):
+        writers = []
+
+        def make(**kwargs):
+            writer = AttachmentWriter(reporter=reporter, file_logger=AllureFileLogger(tmp_path), **kwargs)
+            writers.append(writer)
+            return writer
+
+        yield make
+        for writer in writers:
+            writer.close()
+
+    @pytest.mark.regression
+    @allure.title("Identical payloads are written once")
+    def test_identical_payloads_share_file(self, writer_factory, reporter, tmp_path, logger):
+        writer = writer_factory()
+
+        writer.attach("same payload", "First")
+        writer.attach("same payload", "Second")
+        writer.close()
+
+        assert [name for name, _ in reporter.attachments] == ["First", "Second"]
+        assert len({file_name for _, file_name in reporter.attachments}) == 1
+        written = list(tmp_path.glob("*-attachment.txt"))
+        assert len(written) == 1
+        assert written[0].read_text() == "same payload"
+
+    @pytest.mark.regression
+    @allure.title("Large payloads are truncated")
+    def test_large_payload_truncated(self, writer_factory, tmp_path, logger):
+        writer = writer_factory(max_bytes=16)
+
+        writer.attach("x" * 100, "Large Body")
+        writer.close()
+
+        written = list(tmp_path.glob("*-attachment.txt"))
+        assert len(written) == 1
+        assert written[0].read_text() == "x" * 16 + "\n... [truncated 84 bytes]"
+
+    @pytest.mark.regression
+    @allure.title("Skipped types are not stringified")
+    def test_skip_types_not_stringified(self, writer_factory, reporter, tmp_path, logger):
+        class Unprintable:
+            def __str__(self):
+                raise AssertionError("should not be stringified")
+
+        writer = writer_factory(skip_types=(Unprintable,))
+        writer.attach(Unprintable(), "Fixture: client")
+        writer.close()
+
+        assert reporter.attachments == []
+        assert list(tmp_path.iterdir()) == []
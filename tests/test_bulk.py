@@ -0,0 +1,101 @@
+import itertools
+import threading
+import time
+
+import pytest
+import allure
+import requests
+
+from api_client.bulk import IDEMPOTENCY_HEADER
+from api_client.client import JSONPlaceholderClient
+
+
+class RecordingSession(requests.Session):
+    """Echoes writes back and records concurrency and idempotency keys."""
+
+    def __init__(self, fail_ids=()):
+        super().__init__()
+        self.fail_ids = set(fail_ids)
+        self.keys = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+
+    def request(self, method, url, json=None, headers=None, **kwargs):
+        with self._lock:
+            self.keys.append((headers or {}).get(IDEMPOTENCY_HEADER))
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            time.sleep(0.01)
+            if json and json.get("id") in self.fail_ids:
+                raise requests.exceptions.ConnectionError("connection reset")
+            response = requests.Response()
+            response.status_code = 201 if method == "POST" else 200
+            response._content = b"{}"
+            return response
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+
+
+@pytest.fixture
+def bulk_client():
+    client = JSONPlaceholderClient("https://example.test", pool_size=4)
+    client.session = RecordingSession(fail_ids={3})
+    yield client
+    client.close()
+
+
+@allure.feature("Posts")
+@allure.story("Bulk Writes")
+@allure.severity(allure.severity_level.NORMAL)
+class TestBulkWrites:
+
+    @pytest.mark.regression
+    @pytest.mark.positive
+    @allure.title("Bulk create streams results with bounded concurrency")
+    def test_create_posts_bounded(self, bulk_client, logger):
+        posts = ({"title": f"t{i}", "body": "b", "userId": 1} for i in range(20))
+
+        results = list(bulk_client.create_posts(posts))
+
+        assert sorted(r.index for r in results) == list(range(20))
+        assert all(r.ok for r in results)
+        assert 1 < bulk_client.session.max_in_flight <= 4
+
+    @pytest.mark.regression
+    @allure.title("Every bulk write carries its own idempotency key")
+    def test_idempotency_keys(self, bulk_client, logger):
+        results = list(bulk_client.delete_posts(range(1, 11)))
+
+        keys = bulk_client.session.keys
+        assert len(set(keys)) == 10 and None not in keys
+        assert {r.idempotency_key for r in results} == set(keys)
+
+    @pytest.mark.regression
+    @pytest.mark.negative
+    @allure.title("Failed items are reported without stopping the batch")
+    def test_failures_reported_per_item(self, bulk_client, logger):
+        posts = [{"id": i, "title": "t", "body": "b", "userId": 1} for i in range(1, 6)]
+
+        results = {r.item["id"]: r for r in bulk_client.update_posts(posts)}
+
+        assert isinstance(results[3].error, requests.exceptions.ConnectionError)
+        assert all(results[i].ok for i in (1, 2, 4, 5))
+
+    @pytest.mark.regression
+    @allure.title("Items are pulled lazily from the iterable")
+    def test_items_pulled_lazily(self, bulk_client, logger):
+        posts = ({"title": f"t{i}", "body": "b", "userId": 1} for i in itertools.count())
+
+        first = list(itertools.islice(bulk_client.create_posts(posts, max_workers=2), 5))
+
+        assert len(first) == 5
+
+    @pytest.mark.regression
+    @allure.title("Single POST gets an idempotency key")
+    def test_single_post_has_key(self, bulk_client, logger):
+        bulk_client.create_post("t", "b", 1)
+
+        assert bulk_client.session.keys[0]
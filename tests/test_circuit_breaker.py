@@ -0,0 +1,100 @@
+import pytest
+import allure
+import requests
+
+from api_client.circuit_breaker import (
+    CLOSED, HALF_OPEN, OPEN, CircuitBreaker, CircuitBreakers, CircuitOpenError
+)
+from api_client.client import APIClient
+from api_client.endpoints import endpoint_template
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class DownSession(requests.Session):
+    def __init__(self):
+        super().__init__()
+        self.calls = 0
+
+    def request(self, method, url, **kwargs):
+        self.calls += 1
+        raise requests.exceptions.ConnectionError("backend down")
+
+
+@allure.feature("Transport")
+@allure.story("Circuit Breaker")
+@allure.severity(allure.severity_level.NORMAL)
+class TestCircuitBreaker:
+
+    @pytest.mark.regression
+    @pytest.mark.parametrize(
+        "path,template",
+        [
+            ("/posts", "/posts"),
+            ("/posts/1", "/posts/{id}"),
+            ("/posts/10/comments", "/posts/{id}/comments"),
+            ("/", "/"),
+        ]
+    )
+    @allure.title("Endpoint templates collapse ids")
+    def test_endpoint_template(self, path, template, logger):
+        assert endpoint_template(path) == template
+
+    @pytest.mark.regression
+    @allure.title("Breaker opens on error rate and recovers through a probe")
+    def test_state_transitions(self, logger):
+        clock = FakeClock()
+        breaker = CircuitBreaker("test", min_calls=4, failure_rate=0.5, open_seconds=10, clock=clock)
+
+        for success in (True, True, False):
+            breaker.record(success, 0.1)
+        assert breaker.state == CLOSED
+
+        breaker.record(False, 0.1)
+        assert breaker.state == OPEN
+        with pytest.raises(CircuitOpenError):
+            breaker.before_call()
+
+        clock.now = 10
+        assert breaker.state == HALF_OPEN
+        breaker.before_call()
+        with pytest.raises(CircuitOpenError):
+            breaker.before_call()
+
+        breaker.record(True, 0.1)
+        assert breaker.state == CLOSED
+
+    @pytest.mark.regression
+    @allure.title("Slow calls open the breaker")
+    def test_slow_calls_trip(self, logger):
+        breaker = CircuitBreaker("test", min_calls=2, slow_call_seconds=1, slow_call_rate=1.0)
+
+        breaker.record(True, 2)
+        breaker.record(True, 2)
+
+        assert breaker.state == OPEN
+
+    @pytest.mark.regression
+    @pytest.mark.negative
+    @allure.title("Client fails fast once the host circuit is open")
+    def test_client_fails_fast(self, logger):
+        breakers = CircuitBreakers(min_calls=3)
+        client = APIClient("https://example.test", circuit_breakers=breakers)
+        client.session = DownSession()
+
+        for post_id in range(3):
+            with pytest.raises(requests.exceptions.ConnectionError):
+                client.get(f"posts/{post_id}")
+
+        with pytest.raises(CircuitOpenError):
+            client.get("users")
+
+        assert client.session.calls == 3
+        assert breakers.open_circuits() == ["example.test", "GET example.test/posts/{id}"]
+        client.close()
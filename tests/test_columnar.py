@@ -0,0 +1,93 @@
+import pytest
+import allure
+
+from models.columnar import load_columnar
+
+np = pytest.importorskip("numpy")
+
+EMAIL_PATTERN = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
+
+
+def comment(comment_id, post_id, name="name", email="user@example.com", body="body"):
+    return {"postId": post_id, "id": comment_id, "name": name, "email": email, "body": body}
+
+
+@pytest.fixture
+def comments():
+    return load_columnar([
+        comment(1, 1),
+        comment(2, 1, name="   "),
+        comment(3, 2, email="not-an-email"),
+        comment(3, 99),
+        {"postId": None, "id": 5, "name": "name", "email": "user@example.com"},
+    ])
+
+
+@allure.feature("Models")
+@allure.story("Columnar Checks")
+@allure.severity(allure.severity_level.NORMAL)
+class TestColumnarDataset:
+
+    @pytest.mark.regression
+    @allure.title("Duplicate ids are detected")
+    def test_duplicated_ids(self, comments, logger):
+        assert comments["id"].duplicated().tolist() == [3]
+        assert not comments["id"].is_unique()
+        assert comments["email"].duplicated() == ["user@example.com"]
+
+    @pytest.mark.regression
+    @allure.title("Foreign keys missing from the parent column are reported")
+    def test_not_in(self, comments, logger):
+        posts = load_columnar([{"id": 1}, {"id": 2}])
+
+        assert comments.rows(comments["postId"].not_in(posts["id"])) == [3]
+        assert comments.rows(comments["postId"].not_in([1])) == [3, 3]
+
+    @pytest.mark.regression
+    @allure.title("Out of range values are reported, nulls ignored")
+    def test_out_of_range(self, comments, logger):
+        assert comments.rows(comments["postId"].out_of_range(low=1, high=10)) == [3]
+        assert comments.rows(comments["postId"].not_equal(1)) == [3, 3, 5]
+
+    @pytest.mark.regression
+    @allure.title("Null and blank values are reported per column")
+    def test_null_or_blank(self, comments, logger):
+        empty = comments.null_or_blank()
+
+        assert empty["postId"].tolist() == [4]
+        assert empty["name"].tolist() == [1]
+        assert empty["body"].tolist() == [4]
+        assert "email" not in empty
+
+    @pytest.mark.regression
+    @allure.title("Pattern mismatches map back to rows")
+    def test_not_matching(self, comments, logger):
+        mask = comments["email"].not_matching(EMAIL_PATTERN)
+
+        assert comments.rows(mask) == [3]
+        assert comments.rows(mask, key="email") == ["not-an-email"]
+
+    @pytest.mark.regression
+    @pytest.mark.negative
+    @allure.title("Empty input requires explicit fields")
+    def test_empty_records(self, logger):
+        with pytest.raises(ValueError):
+            load_columnar([])
+
+        empty = load_columnar([], {"id": int})
+        assert len(empty) == 0 and empty["id"].is_unique()
+
+    @pytest.mark.regression
+    @allure.title("Large stand-in dataset")
+    def test_large_dataset(self, logger):
+        size = 200_000
+        records = [comment(i, i // 5 + 1, email=f"user{i % 1000}@example.com") for i in range(1, size + 1)]
+        records[12345]["body"] = ""
+        records[54321]["postId"] = size
+        data = load_columnar(records)
+        posts = load_columnar([{"id": i} for i in range(1, size // 5 + 2)])
+
+        assert data["id"].is_unique()
+        assert len(data["email"].categories) == 1000
+        assert data.rows(data["postId"].not_in(posts["id"])) == [54322]
+        assert data.null_or_blank("body")["body"].tolist() == [12345]
@@ -1,9 +1,11 @@
 import pytest
 import allure
 import re
-from pydantic import ValidationError
+from pydantic import EmailStr, TypeAdapter, ValidationError
 
-from models.schemas import Comment
+from models.schemas import Comment, _check_email, validate_emails
+from models.columnar import load_columnar
+from reporting.attachments import attach
 
 
 @allure.feature("Comments")
@@ -20,7 +22,7 @@ class TestGetPostComments:
 
         with allure.step("Validate status code"):
             assert response.status_code == 200
-            allure.attach(
+            attach(
                 str(response.status_code), "Status Code", allure.attachment_type.TEXT
             )
 
@@ -29,7 +31,7 @@ class TestGetPostComments:
             assert isinstance(comments_data, list)
             assert len(comments_data) > 0
 
-            allure.attach(
+            attach(
                 f"Total comments: {len(comments_data)}",
                 "Comments Count",
                 allure.attachment_type.TEXT
@@ -40,7 +42,7 @@ class TestGetPostComments:
             try:
                 [Comment(**comment) for comment in comments_data]
             except ValidationError as e:
-                allure.attach(str(e), "Validation Error", allure.attachment_type.TEXT)
+                attach(str(e), "Validation Error", allure.attachment_type.TEXT)
                 pytest.fail(f"Schema validation failed: {e}")
 
         with allure.step("Check required fields"):
@@ -59,10 +61,13 @@ class TestCommentsPostRelationship:
     @pytest.mark.smoke
     @pytest.mark.positive
     @allure.title("Validate postId for each comment")
-    def test_all_comments_belong_to_post(self, api_client, test_post_id, logger):
+    def test_all_comments_belong_to_post(self, api_client, dataset, test_post_id, logger):
         response = api_client.get_post_comments(test_post_id)
         comments = response.json()
 
+        expected_ids = {c["id"] for c in dataset.comments_for_post(test_post_id)}
+        assert {c.get("id") for c in comments} == expected_ids
+
         invalid_comments = [
             {
                 "comment_id": c.get("id"),
@@ -74,7 +79,7 @@ class TestCommentsPostRelationship:
         ]
 
         if invalid_comments:
-            allure.attach(
+            attach(
                 str(invalid_comments), "Invalid Comments", allure.attachment_type.JSON
             )
             pytest.fail(f"Found {len(invalid_comments)} comments with wrong postId")
@@ -112,7 +117,7 @@ class TestCommentEmailValidation:
         ]
 
         if invalid:
-            allure.attach(str(invalid), "Invalid Emails", allure.attachment_type.JSON)
+            attach(str(invalid), "Invalid Emails", allure.attachment_type.JSON)
             pytest.fail(f"Found {len(invalid)} invalid emails")
 
         logger.info(f"Validated {len(comments)} emails")
@@ -131,11 +136,45 @@ class TestCommentEmailValidation:
                 errors.append({"comment_id": comment.get("id"), "error": str(e)})
 
         if errors:
-            allure.attach(str(errors), "Validation Errors", allure.attachment_type.JSON)
+            attach(str(errors), "Validation Errors", allure.attachment_type.JSON)
             pytest.fail(f"Pydantic validation failed for {len(errors)} comments")
 
         logger.info(f"All {len(comments)} comments passed Pydantic validation")
 
+    @pytest.mark.regression
+    @pytest.mark.negative
+    @allure.title("Bulk email validation matches the Pydantic model")
+    def test_bulk_email_validation_matches_model(self, logger):
+        emails = ["Eliseo@gardner.biz", "Eliseo@gardner.biz", "invalid", "user@localhost", None]
+        errors = validate_emails(emails)
+        email_adapter = TypeAdapter(EmailStr)
+
+        assert sorted(errors) == [2, 3, 4]
+
+        for i, email in enumerate(emails):
+            comment = {"postId": 1, "id": i + 1, "name": "name", "email": email, "body": "body"}
+            try:
+                Comment(**comment)
+            except ValidationError as e:
+                assert errors[i] == e.errors()[0]["msg"]
+                with pytest.raises(ValidationError) as reference:
+                    email_adapter.validate_python(email)
+                assert e.errors()[0]["msg"] == reference.value.errors()[0]["msg"]
+            else:
+                assert i not in errors
+
+    @pytest.mark.regression
+    @allure.title("Comment model reuses cached email validation")
+    def test_comment_email_validation_is_cached(self, logger):
+        email = "cached.comment@example.com"
+        comment = {"postId": 1, "id": 1, "name": "name", "email": email, "body": "body"}
+        Comment(**comment)
+        hits = _check_email.cache_info().hits
+
+        assert Comment(**comment).email == email
+        assert _check_email.cache_info().hits == hits + 1, \
+            "Comment.email no longer goes through the cached email check"
+
 
 @allure.feature("Comments")
 @allure.story("Comments Content")
@@ -158,7 +197,7 @@ class TestCommentsContent:
                 empty.append({"comment_id": c.get("id"), "field": "body"})
 
         if empty:
-            allure.attach(str(empty), "Empty Fields", allure.attachment_type.JSON)
+            attach(str(empty), "Empty Fields", allure.attachment_type.JSON)
             pytest.fail(f"Found {len(empty)} empty fields")
 
         logger.info("All comment fields contain data")
@@ -183,7 +222,7 @@ class TestCommentsContent:
                     errors.append({"comment_id": cid, "field": f})
 
         if errors:
-            allure.attach(str(errors), "Type Errors", allure.attachment_type.JSON)
+            attach(str(errors), "Type Errors", allure.attachment_type.JSON)
             pytest.fail(f"Found {len(errors)} type errors")
 
         logger.info(f"Validated data types in {len(comments)} comments")
@@ -196,9 +235,36 @@ class TestCommentsQuery:
 
     @pytest.mark.regression
     @allure.title("Get comments by query param")
-    def test_get_comments_by_query_param(self, api_client, test_post_id, logger):
+    def test_get_comments_by_query_param(self, api_client, dataset, test_post_id, logger):
         response = api_client.get_comments(post_id=test_post_id)
         comments = response.json()
 
         assert all(c["postId"] == test_post_id for c in comments)
+        assert {c["id"] for c in comments} == {c["id"] for c in dataset.comments_for_post(test_post_id)}
         logger.info(f"Retrieved {len(comments)} comments via query param")
+
+
+@allure.feature("Comments")
+@allure.story("Whole Collection Checks")
+@allure.severity(allure.severity_level.NORMAL)
+class TestCommentsColumnar:
+
+    @pytest.mark.regression
+    @allure.title("Validate all comments against posts column-wise")
+    def test_all_comments_reference_existing_posts(self, api_client, logger):
+        pytest.importorskip("numpy")
+
+        posts = load_columnar(api_client.get_posts().json(), {"id": int})
+        comments = load_columnar(api_client.get_comments().json())
+
+        assert comments["id"].is_unique()
+
+        orphans = comments.rows(comments["postId"].not_in(posts["id"]))
+        if orphans:
+            attach(str(orphans), "Orphan Comments", allure.attachment_type.JSON)
+            pytest.fail(f"Found {len(orphans)} comments referencing missing posts")
+
+        empty = comments.null_or_blank("name", "email", "body")
+        assert not empty
+
+        logger.info(f"Validated {len(comments)} comments column-wise")
@@ -0,0 +1,131 @@
+import pytest
+import allure
+
+from config.config import test_config
+from models.schemas import Comment, Post, User
+from models.snapshots import CollectionSnapshot, ContractSnapshotStore, schema_fingerprint, validate_changed
+from reporting.attachments import attach
+
+
+@pytest.fixture
+def snapshot_store(tmp_path):
+    # Snapshots survive between runs only when explicitly requested.
+    if test_config.CONTRACT_SNAPSHOT_PERSIST:
+        return ContractSnapshotStore()
+    return ContractSnapshotStore(tmp_path)
+
+
+@allure.feature("Contracts")
+@allure.story("Snapshot Diff")
+@allure.severity(allure.severity_level.CRITICAL)
+class TestContractSnapshots:
+
+    @pytest.mark.regression
+    @pytest.mark.parametrize(
+        "collection,model",
+        [
+            ("posts", Post),
+            ("comments", Comment),
+            ("users", User),
+        ]
+    )
+    @allure.title("Validate changed records against the contract")
+    def test_changed_records_match_contract(self, api_client, snapshot_store, collection, model, logger):
+        response = api_client.get(collection)
+        assert response.status_code == 200
+        records = response.json()
+
+        diff, snapshot = snapshot_store.compare(collection, records, model=model)
+        attach(
+            f"Added: {len(diff.added)}\nChanged: {len(diff.changed)}\nRemoved: {len(diff.removed)}",
+            "Snapshot Diff",
+            allure.attachment_type.TEXT
+        )
+
+        errors = validate_changed(records, diff, model)
+        if errors:
+            attach(str(errors), "Validation Errors", allure.attachment_type.JSON)
+            pytest.fail(f"Schema validation failed for {len(errors)} {collection}")
+
+        snapshot_store.save(collection, snapshot)
+        logger.info(f"{collection}: validated {len(diff.touched)} of {len(records)} records")
+
+
+@allure.feature("Contracts")
+@allure.story("Merkle Tree")
+@allure.severity(allure.severity_level.NORMAL)
+class TestMerkleSnapshot:
+
+    @staticmethod
+    def posts(count):
+        return [{"userId": 1, "id": i, "title": f"title {i}", "body": "body"} for i in range(1, count + 1)]
+
+    @pytest.mark.regression
+    @allure.title("Identical collections have equal roots")
+    def test_identical_roots(self, logger):
+        old = CollectionSnapshot.from_records(self.posts(100))
+        new = CollectionSnapshot.from_records(list(reversed(self.posts(100))))
+
+        assert old.root == new.root
+        assert not old.diff(new)
+
+    @pytest.mark.regression
+    @allure.title("Added, changed and removed records are reported")
+    def test_diff_reports_changes(self, logger):
+        records = self.posts(100)
+        old = CollectionSnapshot.from_records(records, buckets=16)
+
+        records[4]["title"] = "edited"
+        records.pop(9)
+        records.append({"userId": 2, "id": 101, "title": "new", "body": "body"})
+        diff = old.diff(CollectionSnapshot.from_records(records, buckets=16))
+
+        assert diff.changed == ["5"]
+        assert diff.removed == ["10"]
+        assert diff.added == ["101"]
+
+    @pytest.mark.regression
+    @allure.title("Only changed records are validated")
+    def test_only_changed_records_validated(self, tmp_path, logger):
+        store = ContractSnapshotStore(tmp_path)
+        records = self.posts(10)
+        diff, snapshot = store.compare("posts", records)
+        assert len(diff.added) == 10
+        store.save("posts", snapshot)
+
+        records[0]["title"] = ""
+        diff, _ = store.compare("posts", records)
+
+        assert diff.touched == ["1"]
+        assert list(validate_changed(records, diff, Post)) == ["1"]
+
+    @pytest.mark.regression
+    @allure.title("Non-ASCII record keys are supported")
+    def test_non_ascii_keys(self, logger):
+        old = CollectionSnapshot.from_records([{"id": 1, "name": "Zoë"}, {"id": 2, "name": "Влад"}], key="name")
+        new = CollectionSnapshot.from_records([{"id": 3, "name": "Zoë"}, {"id": 2, "name": "Влад"}], key="name")
+
+        assert old.diff(new).changed == ["Zoë"]
+
+    @pytest.mark.regression
+    @allure.title("A schema change re-validates every record")
+    def test_schema_change_revalidates_all(self, tmp_path, logger):
+        store = ContractSnapshotStore(tmp_path)
+        records = self.posts(10)
+        _, snapshot = store.compare("posts", records, model=Post)
+        store.save("posts", snapshot)
+
+        diff, _ = store.compare("posts", records, model=Post)
+        assert not diff
+
+        diff, _ = store.compare("posts", records, model=Comment)
+        assert diff.changed == sorted(str(r["id"]) for r in records)
+
+    @pytest.mark.regression
+    @allure.title("Schema fingerprint is stored with the snapshot")
+    def test_schema_fingerprint_round_trip(self, logger):
+        snapshot = CollectionSnapshot.from_records(self.posts(5), schema=schema_fingerprint(Post))
+        restored = CollectionSnapshot.from_dict(snapshot.to_dict())
+
+        assert restored.schema == schema_fingerprint(Post) != schema_fingerprint(User)
+        assert not snapshot.diff(restored)
@@ -0,0 +1,134 @@
+import pytest
+import allure
+
+from api_client.dataset import DatasetSnapshot
+from reporting.attachments import attach
+
+
+class StubResponse:
+    def __init__(self, data):
+        self.data = data
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return self.data
+
+
+class StubClient:
+    """Serves canned collections and records which endpoints were fetched."""
+
+    def __init__(self, posts, users, comments):
+        self.collections = {"posts": posts, "users": users, "comments": comments}
+        self.calls = []
+
+    def get(self, endpoint):
+        self.calls.append(endpoint)
+        return StubResponse(self.collections[endpoint])
+
+
+def stub_client(**overrides):
+    collections = {
+        "posts": [{"id": i, "userId": 1 + (i - 1) // 2} for i in range(1, 5)],
+        "users": [{"id": 1, "email": "a@example.com"}, {"id": 2, "email": "B@example.com"}],
+        "comments": [{"id": i, "postId": 1 + (i - 1) // 3} for i in range(1, 13)],
+    }
+    collections.update(overrides)
+    return StubClient(**collections)
+
+
+@allure.feature("Dataset")
+@allure.story("Referential Integrity")
+@allure.severity(allure.severity_level.CRITICAL)
+class TestDatasetIntegrity:
+
+    @pytest.mark.regression
+    @allure.title("Validate relationships across the whole dataset")
+    def test_dataset_referential_integrity(self, dataset, logger):
+        errors = dataset.integrity_errors()
+
+        if errors:
+            attach(str(errors), "Integrity Errors", allure.attachment_type.JSON)
+            pytest.fail(f"Found {len(errors)} integrity errors")
+
+        logger.info(
+            f"Validated {len(dataset.posts)} posts, {len(dataset.users)} users "
+            f"and {len(dataset.comments)} comments"
+        )
+
+
+@allure.feature("Dataset")
+@allure.story("Dataset Uniqueness")
+@allure.severity(allure.severity_level.NORMAL)
+class TestDatasetUniqueness:
+
+    @pytest.mark.regression
+    @allure.title("Users are unique by email")
+    def test_users_unique_by_email(self, dataset, logger):
+        assert len(dataset.users_by_email) == len(dataset.users)
+
+        for user in dataset.users:
+            assert dataset.user_by_email(user["email"]) is user
+
+
+@allure.feature("Dataset")
+@allure.story("Snapshot Behaviour")
+@allure.severity(allure.severity_level.NORMAL)
+class TestDatasetSnapshotStub:
+
+    @pytest.mark.regression
+    @allure.title("Loading fetches every collection once")
+    def test_load_fetches_all_collections(self, logger):
+        client = stub_client()
+        snapshot = DatasetSnapshot(client).load()
+
+        assert sorted(client.calls) == ["comments", "posts", "users"]
+        assert [p["id"] for p in snapshot.posts_for_user(2)] == [3, 4]
+        assert snapshot.user_by_email("b@EXAMPLE.com")["id"] == 2
+        assert not snapshot.integrity_errors()
+
+    @pytest.mark.regression
+    @allure.title("Refresh refetches only the requested collection")
+    def test_refresh_single_collection(self, logger):
+        client = stub_client()
+        snapshot = DatasetSnapshot(client).load()
+        client.calls.clear()
+        client.collections["users"] = [{"id": 3, "email": "c@example.com"}]
+
+        snapshot.refresh("users")
+
+        assert client.calls == ["users"]
+        assert snapshot.user(3) is not None and snapshot.user(1) is None
+        assert len(snapshot.posts) == 4
+
+    @pytest.mark.regression
+    @pytest.mark.negative
+    @allure.title("Unknown collection is rejected")
+    def test_unknown_collection(self, logger):
+        with pytest.raises(ValueError):
+            DatasetSnapshot(stub_client()).refresh("albums")
+
+    @pytest.mark.regression
+    @pytest.mark.negative
+    @allure.title("Duplicate ids are reported")
+    def test_duplicate_ids_reported(self, logger):
+        users = [{"id": 1, "email": "a@example.com"}, {"id": 2, "email": "b@example.com"},
+                 {"id": 2, "email": "c@example.com"}]
+        snapshot = DatasetSnapshot(stub_client(users=users)).load()
+
+        assert {"collection": "users", "id": 2, "issue": "duplicate id"} in snapshot.integrity_errors()
+
+    @pytest.mark.regression
+    @pytest.mark.negative
+    @allure.title("Orphan posts and comments are reported")
+    def test_orphans_reported(self, logger):
+        posts = [{"id": 1, "userId": 1}, {"id": 2, "userId": 99}]
+        comments = [{"id": 1, "postId": 1}, {"id": 2, "postId": 42}]
+        snapshot = DatasetSnapshot(stub_client(posts=posts, comments=comments)).load()
+
+        errors = snapshot.integrity_errors()
+
+        assert {"collection": "posts", "id": 2, "issue": "unknown userId 99"} in errors
+        assert {"collection": "comments", "id": 2, "issue": "unknown postId 42"} in errors
+        assert len(errors) == 2
@@ -0,0 +1,109 @@
+import threading
+import time
+
+import pytest
+import allure
+import requests
+
+from api_client.client import APIClient
+from api_client.hedging import HedgePolicy, LatencyTracker
+
+
+class SlowFirstSession(requests.Session):
+    """Session whose first GET stalls, so the hedged copy wins."""
+
+    def __init__(self, stall: float):
+        super().__init__()
+        self.stall = stall
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def get(self, url, **kwargs):
+        with self._lock:
+            self.calls += 1
+            call = self.calls
+        time.sleep(self.stall if call == 1 else 0.01)
+        response = requests.Response()
+        response.status_code = 200
+        response._content = f'{{"call": {call}}}'.encode()
+        response.elapsed = response.elapsed.__class__(seconds=0)
+        return response
+
+
+def primed_policy(latency: float, **kwargs) -> HedgePolicy:
+    policy = HedgePolicy(min_samples=5, **kwargs)
+    for _ in range(5):
+        policy.latencies.record(latency)
+    return policy
+
+
+@allure.feature("Transport")
+@allure.story("Hedged Requests")
+@allure.severity(allure.severity_level.NORMAL)
+class TestHedgedRequests:
+
+    @pytest.mark.regression
+    @allure.title("Latency percentile over the rolling window")
+    def test_latency_percentile(self, logger):
+        tracker = LatencyTracker(window=100)
+        for ms in range(1, 101):
+            tracker.record(ms / 1000)
+
+        assert tracker.percentile(50) == 0.05
+        assert tracker.percentile(99) == 0.099
+
+    @pytest.mark.regression
+    @pytest.mark.positive
+    @allure.title("Slow GET is hedged and the faster response wins")
+    def test_slow_get_is_hedged(self, logger):
+        client = APIClient("https://example.test", hedge=primed_policy(0.02, max_ratio=1))
+        client.session = SlowFirstSession(stall=1)
+
+        started = time.monotonic()
+        response = client.get("posts/1")
+
+        assert time.monotonic() - started < 0.5
+        assert response.json() == {"call": 2}
+        assert client.hedge_policy.hedges == 1
+        client.close()
+
+    @pytest.mark.regression
+    @allure.title("Hedge ratio cap is respected")
+    def test_hedge_ratio_cap(self, logger):
+        policy = primed_policy(0.02, percentile=50, max_ratio=0.5)
+        client = APIClient("https://example.test", hedge=policy)
+        client.session = SlowFirstSession(stall=0.2)
+
+        for _ in range(3):
+            client.session.calls = 0
+            client.get("posts/1")
+
+        assert policy.requests == 3
+        assert policy.hedges == 1
+        client.close()
+
+    @pytest.mark.regression
+    @allure.title("Hedged wins do not push the hedge delay up")
+    def test_hedged_wins_keep_delay(self, logger):
+        policy = primed_policy(0.05, max_ratio=1)
+        client = APIClient("https://example.test", hedge=policy)
+        client.session = SlowFirstSession(stall=0.3)
+        delay = policy.delay()
+
+        for _ in range(5):
+            client.session.calls = 0
+            assert client.get("posts/1").json() == {"call": 2}
+
+        assert policy.hedges == 5
+        assert policy.delay() <= delay
+        client.close()
+
+    @pytest.mark.regression
+    @allure.title("No hedging before enough latency samples")
+    def test_no_hedge_without_samples(self, logger):
+        client = APIClient("https://example.test", hedge=HedgePolicy(min_samples=5, max_ratio=1))
+        client.session = SlowFirstSession(stall=0.1)
+
+        assert client.get("posts/1").json() == {"call": 1}
+        assert client.hedge_policy.hedges == 0
+        client.close()
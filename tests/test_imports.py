@@ -0,0 +1,43 @@
+import subprocess
+import sys
+
+import pytest
+import allure
+
+
+@allure.feature("Tooling")
+@allure.story("Import Time")
+@allure.severity(allure.severity_level.MINOR)
+class TestLazyImports:
+
+    @pytest.mark.regression
+    @pytest.mark.parametrize(
+        "package,heavy_modules",
+        [
+            ("api_client", ["requests", "urllib3"]),
+            ("models", ["pydantic", "email_validator", "numpy"]),
+            ("reporting", ["allure"]),
+            ("reporting.profiling", ["requests", "urllib3"]),
+        ]
+    )
+    @allure.title("Package import does not load heavy dependencies")
+    def test_package_import_is_lazy(self, package, heavy_modules, logger):
+        code = (
+            f"import sys, {package}; "
+            f"print(','.join(m for m in {heavy_modules!r} if m in sys.modules))"
+        )
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+
+        assert result.stdout.strip() == ""
+
+    @pytest.mark.regression
+    @allure.title("Collecting the API tests does not load optional features")
+    def test_collection_skips_optional_features(self, logger):
+        optional = ["numpy", "reporting.profiling", "api_client.hedging", "api_client.circuit_breaker"]
+        code = (
+            "import sys, tests.conftest, tests.test_posts, tests.test_users, tests.test_comments; "
+            f"print(','.join(m for m in {optional!r} if m in sys.modules))"
+        )
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+
+        assert result.stdout.strip() == ""
@@ -3,6 +3,7 @@ import allure
 from pydantic import ValidationError
 
 from models.schemas import Post
+from reporting.attachments import attach
 
 
 @allure.feature("Posts")
@@ -19,7 +20,7 @@ class TestGetPosts:
 
         with allure.step("Validate status code"):
             assert response.status_code == 200
-            allure.attach(str(response.status_code), "Status Code", allure.attachment_type.TEXT)
+            attach(str(response.status_code), "Status Code", allure.attachment_type.TEXT)
 
         with allure.step("Validate Content-Type"):
             assert "application/json" in response.headers.get("Content-Type", "")
@@ -29,13 +30,13 @@ class TestGetPosts:
             assert isinstance(posts_data, list)
             assert len(posts_data) > 0
 
-            allure.attach(f"Total posts: {len(posts_data)}", "Posts Count", allure.attachment_type.TEXT)
+            attach(f"Total posts: {len(posts_data)}", "Posts Count", allure.attachment_type.TEXT)
 
         with allure.step("Validate schema"):
             try:
                 [Post(**post) for post in posts_data]
             except ValidationError as e:
-                allure.attach(str(e), "Validation Error", allure.attachment_type.TEXT)
+                attach(str(e), "Validation Error", allure.attachment_type.TEXT)
                 pytest.fail(f"Schema validation failed: {e}")
 
         first_post = posts_data[0]
@@ -91,7 +92,7 @@ class TestCreatePost:
     @pytest.mark.positive
     @allure.title("Create a new post")
     def test_create_post(self, api_client, test_post_data, logger):
-        allure.attach(str(test_post_data), "Request Body", allure.attachment_type.JSON)
+        attach(str(test_post_data), "Request Body", allure.attachment_type.JSON)
 
         response = api_client.create_post(
             title=test_post_data["title"],
@@ -110,7 +111,26 @@ class TestCreatePost:
         assert "id" in created_post and isinstance(created_post["id"], int)
 
         logger.info(f"Post created with ID: {created_post['id']}")
-        allure.attach(str(created_post["id"]), "Created Post ID", allure.attachment_type.TEXT)
+        attach(str(created_post["id"]), "Created Post ID", allure.attachment_type.TEXT)
+
+    @pytest.mark.regression
+    @pytest.mark.positive
+    @allure.title("Create posts in bulk")
+    def test_create_posts_bulk(self, api_client, test_post_data, logger):
+        posts = [dict(test_post_data, title=f"Bulk Post {i}") for i in range(5)]
+
+        results = list(api_client.create_posts(posts))
+
+        failed = [{"index": r.index, "error": str(r.error)} for r in results if not r.ok]
+        if failed:
+            attach(str(failed), "Failed Items", allure.attachment_type.JSON)
+            pytest.fail(f"{len(failed)} bulk writes failed")
+
+        for result in results:
+            assert result.response.status_code == 201
+            assert result.response.json()["title"] == posts[result.index]["title"]
+
+        logger.info(f"Created {len(results)} posts in bulk")
 
 
 @allure.feature("Posts")
@@ -128,7 +148,7 @@ class TestUpdatePost:
             "userId": 1
         }
 
-        allure.attach(str(updated_data), "Updated Data", allure.attachment_type.JSON)
+        attach(str(updated_data), "Updated Data", allure.attachment_type.JSON)
 
         response = api_client.update_post(
             post_id=test_post_id,
@@ -196,12 +216,13 @@ class TestParametrizedPosts:
         ]
     )
     @allure.title("Validate post count per user")
-    def test_posts_count_by_user(self, api_client, user_id, expected_posts, logger):
+    def test_posts_count_by_user(self, api_client, dataset, user_id, expected_posts, logger):
         response = api_client.get_posts(user_id=user_id)
 
         assert response.status_code == 200
 
         posts = response.json()
         assert len(posts) == expected_posts
+        assert {p["id"] for p in posts} == {p["id"] for p in dataset.posts_for_user(user_id)}
 
         logger.info(f"User {user_id} has {len(posts)} posts")
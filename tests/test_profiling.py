@@ -0,0 +1,73 @@
+import time
+
+import pytest
+import allure
+
+from reporting.profiling import ProfileCollector
+
+
+def busy(seconds):
+    deadline = time.perf_counter() + seconds
+    data = []
+    while time.perf_counter() < deadline:
+        data.append(bytearray(1024))
+    return len(data)
+
+
+@allure.feature("Reporting")
+@allure.story("Profiling")
+@allure.severity(allure.severity_level.MINOR)
+class TestProfileCollector:
+
+    @pytest.fixture
+    def profiler(self, tmp_path):
+        collector = ProfileCollector(tmp_path, interval=0.001, top=1)
+        collector.start()
+        yield collector
+        collector.stop()
+
+    @pytest.mark.regression
+    @allure.title("CPU, memory and stacks are recorded per test")
+    def test_cpu_profile(self, profiler, logger):
+        with profiler.profile("tests/test_x.py::test_busy") as result:
+            busy(0.1)
+
+        assert result.cpu > 0.05
+        assert result.peak_bytes > 1024 * 10
+        assert any("busy" in stack for stack in result.stacks)
+        assert (profiler.output_dir / "tests_test_x.py_test_busy.folded").exists()
+
+    @pytest.mark.regression
+    @allure.title("Request time is split into network wait and CPU")
+    def test_network_split(self, profiler, logger):
+        with profiler.profile("tests/test_x.py::test_network") as result:
+            time.sleep(0.05)
+            profiler.record_request("GET", "https://example.test/posts/1", wall=0.05, cpu=0.01)
+
+        assert result.requests == 1
+        assert result.network_wait == pytest.approx(0.04)
+        assert "GET https://example.test/posts/{id}" in profiler.endpoints
+
+    @pytest.mark.regression
+    @allure.title("Summary lists the slowest tests")
+    def test_summary(self, profiler, logger):
+        with profiler.profile("fast"):
+            pass
+        with profiler.profile("slow"):
+            time.sleep(0.02)
+
+        lines = profiler.write_summary()
+
+        assert lines[1].endswith("slow")
+        assert (profiler.output_dir / "summary.txt").read_text().splitlines() == lines
+
+    @pytest.mark.regression
+    @allure.title("xdist workers write separate summaries")
+    def test_summary_file_per_worker(self, tmp_path, logger):
+        collector = ProfileCollector(tmp_path, summary_file="summary-gw1.txt")
+        with collector.profile("test"):
+            pass
+
+        collector.write_summary()
+
+        assert [p.name for p in tmp_path.glob("summary*.txt")] == ["summary-gw1.txt"]
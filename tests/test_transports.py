@@ -0,0 +1,136 @@
+import pytest
+import allure
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from api_client import transports
+from api_client.client import APIClient
+
+
+def mock_adapter(handler, max_retries=None):
+    httpx = pytest.importorskip("httpx")
+    pytest.importorskip("h2")
+    return transports.HTTP2Adapter(max_retries, transport=httpx.MockTransport(handler))
+
+
+def mock_api_client(adapter):
+    client = APIClient("https://example.test", http2=True)
+    client.session.mount("https://", adapter)
+    return client
+
+
+@allure.feature("Transport")
+@allure.story("HTTP/2")
+@allure.severity(allure.severity_level.NORMAL)
+class TestHTTP2Transport:
+
+    @pytest.mark.regression
+    @pytest.mark.positive
+    @allure.title("HTTP/2 adapter returns requests responses")
+    def test_http2_adapter_response(self, logger):
+        httpx = pytest.importorskip("httpx")
+
+        def handler(request):
+            return httpx.Response(200, json={"id": 1, "path": request.url.path})
+
+        client = mock_api_client(mock_adapter(handler))
+
+        response = client.get("posts/1")
+
+        assert isinstance(response, requests.Response)
+        assert response.status_code == 200
+        assert response.json() == {"id": 1, "path": "/posts/1"}
+        assert "application/json" in response.headers["Content-Type"]
+        client.close()
+
+    @pytest.mark.regression
+    @allure.title("HTTP/2 adapter retries retryable status codes")
+    def test_http2_adapter_retries_status(self, monkeypatch, logger):
+        httpx = pytest.importorskip("httpx")
+        calls, sleeps = [], []
+        monkeypatch.setattr("urllib3.util.retry.time.sleep", sleeps.append)
+
+        def handler(request):
+            calls.append(request)
+            return httpx.Response(503 if len(calls) < 4 else 200, json={})
+
+        retry = Retry(total=3, backoff_factor=0.1, status_forcelist=[503])
+        client = mock_api_client(mock_adapter(handler, retry))
+
+        assert client.get("posts").status_code == 200
+        assert len(calls) == 4
+        # urllib3 2.x backoff: no sleep before the first retry, then factor * 2 ** (n - 1)
+        assert sleeps == pytest.approx([0.2, 0.4])
+        client.close()
+
+    @pytest.mark.regression
+    @pytest.mark.negative
+    @allure.title("HTTP/2 adapter raises RetryError when retries run out")
+    def test_http2_adapter_retries_exhausted(self, logger):
+        httpx = pytest.importorskip("httpx")
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            return httpx.Response(503, json={})
+
+        retry = Retry(total=2, backoff_factor=0, status_forcelist=[503])
+        client = mock_api_client(mock_adapter(handler, retry))
+
+        with pytest.raises(requests.exceptions.RetryError):
+            client.get("posts")
+        assert len(calls) == 3
+        client.close()
+
+    @pytest.mark.regression
+    @allure.title("HTTP/2 adapter returns the last response without raise_on_status")
+    def test_http2_adapter_returns_last_response(self, logger):
+        httpx = pytest.importorskip("httpx")
+
+        def handler(request):
+            return httpx.Response(503, json={})
+
+        retry = Retry(total=1, backoff_factor=0, status_forcelist=[503], raise_on_status=False)
+        client = mock_api_client(mock_adapter(handler, retry))
+
+        assert client.get("posts").status_code == 503
+        client.close()
+
+    @pytest.mark.regression
+    @allure.title("verify, cert and proxies select their own HTTP/2 client")
+    def test_http2_adapter_request_options(self, logger):
+        httpx = pytest.importorskip("httpx")
+        adapter = mock_adapter(lambda request: httpx.Response(200, json={}))
+        client = mock_api_client(adapter)
+        proxy = "http://proxy.test:3128"
+
+        client.session.get("https://example.test/posts", verify=False, proxies={"https": proxy})
+        client.session.get("https://example.test/posts", verify=False, proxies={"https": proxy})
+
+        assert sum(1 for verify, _, used_proxy in adapter._clients if verify is False and used_proxy == proxy) == 1
+        with pytest.raises(NotImplementedError):
+            client.session.get("https://example.test/posts", stream=True)
+        client.close()
+
+    @pytest.mark.regression
+    @pytest.mark.negative
+    @allure.title("Transport errors are raised as requests exceptions")
+    def test_http2_adapter_maps_errors(self, logger):
+        httpx = pytest.importorskip("httpx")
+
+        def handler(request):
+            raise httpx.ConnectError("refused", request=request)
+
+        client = mock_api_client(mock_adapter(handler))
+
+        with pytest.raises(requests.exceptions.ConnectionError):
+            client.get("posts")
+        client.close()
+
+    @pytest.mark.regression
+    @allure.title("Falls back to HTTP/1.1 without httpx[http2]")
+    def test_fallback_without_http2(self, monkeypatch, logger):
+        monkeypatch.setattr(transports, "httpx", None)
+
+        assert isinstance(transports.create_http2_adapter(), HTTPAdapter)
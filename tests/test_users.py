@@ -4,6 +4,8 @@ import re
 from pydantic import ValidationError
 
 from models.schemas import User
+from models.columnar import load_columnar
+from reporting.attachments import attach
 
 
 @allure.feature("Users")
@@ -18,18 +20,18 @@ class TestGetUsers:
         response = api_client.get_users()
 
         assert response.status_code == 200
-        allure.attach(str(response.status_code), "Status Code", allure.attachment_type.TEXT)
+        attach(str(response.status_code), "Status Code", allure.attachment_type.TEXT)
 
         users_data = response.json()
         assert isinstance(users_data, list)
         assert len(users_data) == 10
 
-        allure.attach(f"Total users: {len(users_data)}", "Users Count", allure.attachment_type.TEXT)
+        attach(f"Total users: {len(users_data)}", "Users Count", allure.attachment_type.TEXT)
 
         try:
             [User(**user) for user in users_data]
         except ValidationError as e:
-            allure.attach(str(e), "Validation Error", allure.attachment_type.TEXT)
+            attach(str(e), "Validation Error", allure.attachment_type.TEXT)
             pytest.fail(f"Schema validation failed: {e}")
 
         user_ids = [u["id"] for u in users_data]
@@ -52,7 +54,7 @@ class TestGetUserById:
         user_data = response.json()
         try:
             user = User(**user_data)
-            allure.attach(
+            attach(
                 f"Name: {user.name}\nEmail: {user.email}\nUsername: {user.username}",
                 "User Info",
                 allure.attachment_type.TEXT
@@ -92,10 +94,10 @@ class TestUserEmailValidation:
         ]
 
         if invalid:
-            allure.attach(str(invalid), "Invalid Emails", allure.attachment_type.JSON)
+            attach(str(invalid), "Invalid Emails", allure.attachment_type.JSON)
             pytest.fail(f"Found {len(invalid)} invalid emails")
 
-        allure.attach(
+        attach(
             f"Validated {len(users)} emails successfully",
             "Validation Result",
             allure.attachment_type.TEXT
@@ -137,7 +139,7 @@ class TestUserAddressStructure:
         assert "lat" in geo and isinstance(geo["lat"], str)
         assert "lng" in geo and isinstance(geo["lng"], str)
 
-        allure.attach(str(address), "Address Structure", allure.attachment_type.JSON)
+        attach(str(address), "Address Structure", allure.attachment_type.JSON)
 
     @pytest.mark.regression
     @allure.title("Validate all user addresses")
@@ -161,7 +163,7 @@ class TestUserAddressStructure:
                 invalid.append({"user_id": user.get("id"), "issue": "invalid geo"})
 
         if invalid:
-            allure.attach(str(invalid), "Invalid Addresses", allure.attachment_type.JSON)
+            attach(str(invalid), "Invalid Addresses", allure.attachment_type.JSON)
             pytest.fail(f"Found {len(invalid)} invalid addresses")
 
 
@@ -185,10 +187,35 @@ class TestUserCompany:
             assert field in company
             assert company[field]
 
-        allure.attach(
+        attach(
             f"Company: {company['name']}\n"
             f"Catch Phrase: {company['catchPhrase']}\n"
             f"BS: {company['bs']}",
             "Company Info",
             allure.attachment_type.TEXT
-        )
\ No newline at end of file
+        )
+
+
+@allure.feature("Users")
+@allure.story("Whole Collection Checks")
+@allure.severity(allure.severity_level.NORMAL)
+class TestUsersColumnar:
+
+    @pytest.mark.regression
+    @allure.title("Validate users collection with columnar checks")
+    def test_users_columnar_checks(self, api_client, logger):
+        pytest.importorskip("numpy")
+
+        response = api_client.get_users()
+        users = load_columnar(response.json())
+
+        assert users["id"].is_unique()
+        assert not users["id"].out_of_range(low=1).any()
+        assert users["email"].is_unique()
+
+        empty = users.null_or_blank("name", "username", "email", "phone")
+        if empty:
+            attach(str(empty), "Empty Fields", allure.attachment_type.JSON)
+            pytest.fail(f"Found empty values in {list(empty)}")
+
+        logger.info(f"Validated {len(users)} users column-wise")
@@ -0,0 +1,87 @@
+"""Import-time report based on ``python -X importtime``.
+
+By default measures what a pytest run imports from this repo: tests.conftest
+plus every tests/test_*.py module, after pytest and the allure plugin are
+already loaded (as they are when pytest collects).
+
+Usage:
+    python -m tools.import_time [module ...] [--top N]
+"""
+import argparse
+import re
+import subprocess
+import sys
+from pathlib import Path
+from typing import List, NamedTuple
+
+TESTS_DIR = Path(__file__).resolve().parent.parent / "tests"
+
+# Loaded by pytest before conftest, so not attributed to the repo's modules.
+PRELOADED = ["pytest", "allure_pytest.plugin"]
+
+LINE_RE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)$")
+
+
+class ImportRecord(NamedTuple):
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+
+def default_modules() -> List[str]:
+    return ["tests.conftest"] + [f"tests.{path.stem}" for path in sorted(TESTS_DIR.glob("test_*.py"))]
+
+
+def measure(modules: List[str]) -> List[ImportRecord]:
+    """Import `modules` in one interpreter, as pytest does, and return their import records."""
+    code = "".join(f"import {module}\n" for module in PRELOADED + modules)
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True, text=True, check=True, cwd=TESTS_DIR.parent
+    )
+    # importtime prints each module after its dependencies, so a depth-0 line
+    # closes a group; only groups rooted in the measured packages are kept, and
+    # interpreter startup and PRELOADED imports are dropped.
+    packages = {module.split(".")[0] for module in modules}
+    records, group = [], []
+    for line in result.stderr.splitlines():
+        match = LINE_RE.match(line)
+        if not match:
+            continue
+        self_us, cumulative_us, indent, name = match.groups()
+        record = ImportRecord(name, int(self_us), int(cumulative_us), (len(indent) - 1) // 2)
+        group.append(record)
+        if record.depth == 0:
+            if name.split(".")[0] in packages:
+                records.extend(group)
+            group = []
+    return records
+
+
+def report(modules: List[str], top: int) -> str:
+    records = measure(modules)
+    roots = [r for r in records if r.depth == 0]
+    total = sum(r.cumulative_us for r in roots)
+    lines = [f"{len(modules)} modules: {total / 1000:.1f} ms total, {len(records)} modules imported"]
+    for record in sorted(roots, key=lambda r: r.cumulative_us, reverse=True):
+        lines.append(f"  {record.cumulative_us / 1000:8.1f} ms  {record.module}")
+    lines.append(f"slowest {top} by self time:")
+    for record in sorted(records, key=lambda r: r.self_us, reverse=True)[:top]:
+        lines.append(
+            f"  {record.self_us / 1000:8.1f} ms self {record.cumulative_us / 1000:8.1f} ms cumulative  {record.module}"
+        )
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("modules", nargs="*", help="modules to import (default: conftest and test modules)")
+    parser.add_argument("--top", type=int, default=10, help="slowest modules to list by self time")
+    args = parser.parse_args(argv)
+
+    print(report(args.modules or default_modules(), args.top))
+
+
+if __name__ == "__main__":
+    main()